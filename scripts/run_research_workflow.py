@@ -12,20 +12,26 @@ Usage:
 """
 
 import argparse
-import json
+import asyncio
+import functools
+import hashlib
 import logging
+import os
 import sys
 import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.agents.workflow import compiled_workflow
+import boto3
+import orjson
+from botocore.exceptions import ClientError
+
 from src.agents.state import ResearchState
 from src.utils.s3_client import S3Client
 from src.utils.cost_tracker import get_cost_tracker, get_query_cost
@@ -37,12 +43,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+BAR = "=" * 70
+
+# One boto3 session per process so AWS credentials are resolved only once
+_SESSION = boto3.Session(region_name=os.getenv("AWS_REGION", "us-east-1"))
+
+# Cached reports older than this are treated as misses and regenerated
+DEFAULT_QUERY_CACHE_TTL_HOURS = float(os.getenv("QUERY_CACHE_TTL_HOURS", "24"))
+
+AGENT_DISPLAY_NAMES = {
+    "search": "Search Agent",
+    "search_agent": "Search Agent",
+    "synthesis": "Synthesis Agent",
+    "validation": "Validation Agent",
+    "hitl_review": "HITL Review",
+    "set_final_report": "Finalizing Report",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def get_s3_client() -> S3Client:
+    """
+    Return a process-wide S3Client.
+
+    The client (and its boto3 connection pool) is built once from the shared
+    session and reused for every S3 operation in this script.
+
+    Returns:
+        Shared S3Client instance.
+    """
+    return S3Client(session=_SESSION)
+
 
 def save_report_to_s3(
     report: str,
     task_id: str,
     user_query: str,
-    metadata: Dict[str, Any]
+    metadata: Dict[str, Any],
+    cache_key: Optional[str] = None,
 ) -> str:
     """
     Save final report to S3 gold/ layer.
@@ -52,6 +90,7 @@ def save_report_to_s3(
         task_id: Task identifier.
         user_query: Original user query.
         metadata: Additional metadata to include.
+        cache_key: Optional query-cache key to store the same report under.
 
     Returns:
         S3 key where the report was saved, or empty string if failed.
@@ -61,7 +100,7 @@ def save_report_to_s3(
         return ""
 
     try:
-        s3_client = S3Client()
+        s3_client = get_s3_client()
         bucket = s3_client.bucket
         
         if not bucket:
@@ -77,37 +116,91 @@ def save_report_to_s3(
             "timestamp": datetime.now().isoformat(),
         }
 
-        # Convert to JSON
-        report_json = json.dumps(report_data, indent=2, ensure_ascii=False)
-
         # Create S3 key: gold/reports/{task_id}.json
         s3_key = f"gold/reports/{task_id}.json"
 
         # Write to temporary file first, then upload
         temp_file = Path(project_root) / "temp" / f"{task_id}_report.json"
         temp_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            f.write(report_json)
+        temp_file.write_bytes(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
 
         # Upload to S3
         success = s3_client.upload_file(str(temp_file), s3_key)
+
+        # Store a copy under the query-cache key for repeat queries
+        if success and cache_key:
+            s3_client.upload_file(str(temp_file), cache_key)
         
         # Clean up temp file
         temp_file.unlink(missing_ok=True)
 
         if success:
-            logger.info(f"Report saved to s3://{bucket}/{s3_key}")
+            logger.info("Report saved to s3://%s/%s", bucket, s3_key)
             return s3_key
         else:
-            logger.error(f"Failed to save report to S3")
+            logger.error("Failed to save report to S3")
             return ""
 
     except Exception as exc:
-        logger.exception(f"Error saving report to S3: {exc}")
+        logger.exception("Error saving report to S3: %s", exc)
         return ""
 
 
+def get_query_cache_key(user_query: str) -> str:
+    """
+    Build the S3 key of the cached report for a query.
+
+    Queries are matched exactly after trimming whitespace and lowercasing.
+
+    Args:
+        user_query: Original user query.
+
+    Returns:
+        S3 key under gold/cache/.
+    """
+    normalized = user_query.strip().lower().encode("utf-8")
+    query_hash = hashlib.sha256(normalized).hexdigest()[:16]
+    return f"gold/cache/{query_hash}.json"
+
+
+def load_cached_report(
+    cache_key: str,
+    ttl_hours: float = DEFAULT_QUERY_CACHE_TTL_HOURS
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a previously saved report for the same query from S3.
+
+    Freshness is judged by the object's LastModified time, which is reset
+    every time save_report_to_s3() rewrites the cache copy.
+
+    Args:
+        cache_key: S3 key returned by get_query_cache_key().
+        ttl_hours: Maximum age of a cached report; older entries are misses.
+
+    Returns:
+        Cached report data, or None on a cache miss, an expired entry or
+        any S3 error.
+    """
+    try:
+        s3_client = get_s3_client()
+        if not s3_client.bucket:
+            return None
+        response = s3_client.s3.get_object(Bucket=s3_client.bucket, Key=cache_key)
+        age = datetime.now(timezone.utc) - response["LastModified"]
+        if age > timedelta(hours=ttl_hours):
+            response["Body"].close()
+            logger.info("Cached report %s expired (%s old)", cache_key, age)
+            return None
+        return orjson.loads(response["Body"].read())
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+            logger.warning("Query cache lookup failed: %s", exc)
+        return None
+    except Exception as exc:
+        logger.warning("Query cache lookup failed: %s", exc)
+        return None
+
+
 def track_agent_progress(state: ResearchState, previous_agent: str = None) -> str:
     """
     Track and print progress as agents complete.
@@ -120,52 +213,48 @@ def track_agent_progress(state: ResearchState, previous_agent: str = None) -> st
         Current agent name.
     """
     current_agent = state.get("current_agent", "unknown")
+
+    # Fast path: nothing to report while the same agent is still running
+    if current_agent == previous_agent:
+        return current_agent
+
+    display_name = AGENT_DISPLAY_NAMES.get(current_agent, current_agent)
+    print(f"\n{BAR}")
+    print(f"✓ {display_name} completed")
+    print(BAR)
     
-    if current_agent != previous_agent:
-        agent_display_names = {
-            "search": "Search Agent",
-            "synthesis": "Synthesis Agent",
-            "validation": "Validation Agent",
-            "hitl_review": "HITL Review",
-            "set_final_report": "Finalizing Report",
-        }
-        
-        display_name = agent_display_names.get(current_agent, current_agent)
-        print(f"\n{'='*70}")
-        print(f"✓ {display_name} completed")
-        print(f"{'='*70}")
-        
-        # Print relevant state info
-        if current_agent == "search":
-            queries = state.get("search_queries", [])
-            results = state.get("search_results", [])
-            print(f"  Generated {len(queries)} search queries")
-            print(f"  Found {len(results)} search results")
-        
-        elif current_agent == "synthesis":
-            word_count = len(state.get("report_draft", "").split())
-            source_count = state.get("source_count", 0)
-            print(f"  Generated {word_count}-word report")
-            print(f"  Used {source_count} sources")
-        
-        elif current_agent == "validation":
-            confidence = state.get("confidence_score", 0.0)
-            needs_hitl = state.get("needs_hitl", False)
-            print(f"  Confidence Score: {confidence:.2f}")
-            print(f"  Needs HITL Review: {needs_hitl}")
-        
-        elif current_agent == "hitl_review":
-            final_report = state.get("final_report", "")
-            if final_report:
-                print(f"  Report approved/edited ({len(final_report)} characters)")
-            else:
-                print(f"  Report rejected - regeneration required")
+    # Print relevant state info
+    if current_agent in ("search", "search_agent"):
+        num_queries = len(state.get("search_queries", ()))
+        num_results = len(state.get("search_results", ()))
+        print(f"  Generated {num_queries} search queries")
+        print(f"  Found {num_results} search results")
+    
+    elif current_agent == "synthesis":
+        report_draft = state.get("report_draft", "")
+        word_count = len(report_draft.split()) if report_draft else 0
+        source_count = state.get("source_count", 0)
+        print(f"  Generated {word_count}-word report")
+        print(f"  Used {source_count} sources")
+    
+    elif current_agent == "validation":
+        confidence = state.get("confidence_score", 0.0)
+        needs_hitl = state.get("needs_hitl", False)
+        print(f"  Confidence Score: {confidence:.2f}")
+        print(f"  Needs HITL Review: {needs_hitl}")
     
+    elif current_agent == "hitl_review":
+        report_length = len(state.get("final_report", ""))
+        if report_length:
+            print(f"  Report approved/edited ({report_length} characters)")
+        else:
+            print(f"  Report rejected - regeneration required")
+
     return current_agent
 
 
-def main():
-    """Main execution function."""
+async def amain():
+    """Main execution function (async, streams workflow progress)."""
     parser = argparse.ArgumentParser(
         description="Run the complete research agent workflow"
     )
@@ -178,20 +267,54 @@ def main():
         "--task-id",
         help="Custom task ID (default: auto-generated UUID)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run the workflow, ignoring any cached report for the query"
+    )
+    parser.add_argument(
+        "--cache-ttl-hours",
+        type=float,
+        default=DEFAULT_QUERY_CACHE_TTL_HOURS,
+        help="Max age of a cached report before it is regenerated "
+             "(default: $QUERY_CACHE_TTL_HOURS or 24)"
+    )
     
     args = parser.parse_args()
 
     # Get user query
     user_query = args.query
     if not user_query:
-        print("\n" + "="*70)
+        print("\n" + BAR)
         print("AI Research Assistant - Workflow Runner")
-        print("="*70)
+        print(BAR)
         user_query = input("\nEnter your research query: ").strip()
         if not user_query:
             print("Error: Query cannot be empty")
             sys.exit(1)
 
+    # Serve an identical earlier query straight from the S3 cache
+    cache_key = get_query_cache_key(user_query)
+    cached = (
+        None if args.no_cache
+        else load_cached_report(cache_key, ttl_hours=args.cache_ttl_hours)
+    )
+    if cached and cached.get("report"):
+        print("\n" + BAR)
+        print("CACHED - report for this query was already generated")
+        print(BAR)
+        print(f"Original Task ID: {cached.get('task_id')}")
+        print(f"Generated At: {cached.get('timestamp')}")
+        print(f"S3 Location: s3://{get_s3_client().bucket}/{cache_key}")
+        print(BAR)
+        print(cached["report"])
+        print(BAR)
+        sys.exit(0)
+
+    # Imported only once a workflow run is actually needed: building the
+    # graph pulls in LangGraph and the LLM/vector-store SDKs
+    from src.agents.workflow import compiled_workflow
+
     # Generate task ID
     task_id = args.task_id or str(uuid.uuid4())
 
@@ -199,12 +322,12 @@ def main():
     cost_tracker = get_cost_tracker()
     cost_tracker.set_task_id(task_id)
 
-    print("\n" + "="*70)
+    print("\n" + BAR)
     print("Starting Research Workflow")
-    print("="*70)
+    print(BAR)
     print(f"Task ID: {task_id}")
     print(f"Query: {user_query}")
-    print("="*70)
+    print(BAR)
 
     # Initialize state
     initial_state: ResearchState = {
@@ -223,25 +346,50 @@ def main():
     }
 
     start_time = time.time()
-    previous_agent = None
+    # The first streamed value echoes the input state, so seed the tracker
+    # with its agent to avoid reporting a step that has not run yet.
+    previous_agent = initial_state["current_agent"]
     error_occurred = False
+    final_state = initial_state
+    save_task = None
 
     try:
         # Run workflow with progress tracking
         print("\nExecuting workflow...")
-        
-        # Use stream_events or invoke with callbacks if available
-        # For now, we'll use invoke and track state changes
-        final_state = compiled_workflow.invoke(initial_state)
-        
-        # Track final agent
-        track_agent_progress(final_state, previous_agent)
+
+        # Stream full state after each node so progress is reported live
+        async for state in compiled_workflow.astream(
+            initial_state, stream_mode="values"
+        ):
+            final_state = state
+            previous_agent = track_agent_progress(state, previous_agent)
+
+            # Start the S3 upload as soon as the report is final so it
+            # overlaps with the remaining nodes and terminal output
+            final_report = state.get("final_report", "")
+            if final_report and save_task is None:
+                metadata = {
+                    "confidence_score": state.get("confidence_score", 0.0),
+                    "needs_hitl": state.get("needs_hitl", False),
+                    "source_count": state.get("source_count", 0),
+                    "execution_time_seconds": time.time() - start_time,
+                }
+                save_task = asyncio.create_task(
+                    asyncio.to_thread(
+                        save_report_to_s3,
+                        report=final_report,
+                        task_id=task_id,
+                        user_query=user_query,
+                        metadata=metadata,
+                        cache_key=cache_key,
+                    )
+                )
 
     except Exception as exc:
-        logger.exception(f"Workflow execution failed: {exc}")
-        print(f"\n{'='*70}")
+        logger.exception("Workflow execution failed: %s", exc)
+        print(f"\n{BAR}")
         print("ERROR: Workflow execution failed")
-        print(f"{'='*70}")
+        print(BAR)
         print(f"Error: {exc}")
         error_occurred = True
         final_state = initial_state
@@ -252,9 +400,9 @@ def main():
     # Check for errors
     error = final_state.get("error")
     if error:
-        print(f"\n{'='*70}")
+        print(f"\n{BAR}")
         print("Workflow completed with errors")
-        print(f"{'='*70}")
+        print(BAR)
         print(f"Error: {error}")
         error_occurred = True
 
@@ -265,77 +413,83 @@ def main():
         logger.warning("No final report generated")
         print("\nWarning: No final report was generated")
 
-    # Save to S3
+    # Print final report (the S3 upload keeps running in the background)
     if final_report:
-        print(f"\n{'='*70}")
+        print(f"\n{BAR}")
+        print("FINAL REPORT")
+        print(BAR)
+        print(final_report)
+        print(BAR)
+
+    # Save to S3. The upload is awaited even if streaming failed after it
+    # started, so its outcome is reported instead of being dropped when the
+    # event loop closes
+    s3_key = ""
+    if save_task is not None:
+        print(f"\n{BAR}")
         print("Saving Report to S3")
-        print(f"{'='*70}")
-        
-        metadata = {
-            "confidence_score": final_state.get("confidence_score", 0.0),
-            "needs_hitl": final_state.get("needs_hitl", False),
-            "source_count": final_state.get("source_count", 0),
-            "execution_time_seconds": execution_time,
-        }
-        
-        s3_key = save_report_to_s3(
-            report=final_report,
-            task_id=task_id,
-            user_query=user_query,
-            metadata=metadata
-        )
+        print(BAR)
+
+        s3_key = await save_task
         
         if s3_key:
             print(f"✓ Report saved to S3: {s3_key}")
         else:
             print("✗ Failed to save report to S3")
 
-    # Print final report
-    if final_report:
-        print(f"\n{'='*70}")
-        print("FINAL REPORT")
-        print(f"{'='*70}")
-        print(final_report)
-        print(f"{'='*70}")
-
-    # Print summary
-    print(f"\n{'='*70}")
-    print("Execution Summary")
-    print(f"{'='*70}")
-    print(f"Task ID: {task_id}")
-    print(f"Query: {user_query}")
-    print(f"Execution Time: {execution_time:.2f} seconds")
-    print(f"Final Report Length: {len(final_report)} characters")
-    print(f"Word Count: {len(final_report.split()) if final_report else 0} words")
-    print(f"Confidence Score: {final_state.get('confidence_score', 0.0):.2f}")
-    print(f"Sources Used: {final_state.get('source_count', 0)}")
-    print(f"Error: {error if error else 'None'}")
-    
-    if final_report and s3_key:
-        print(f"S3 Location: s3://{S3Client().bucket}/{s3_key}")
-    
     # Display cost information
     task_cost = get_query_cost(task_id)
     total_cost = cost_tracker.get_total_cost()
     cost_by_operation = cost_tracker.get_cost_by_operation()
-    
-    print(f"\nCost Information:")
-    print(f"  Task Cost: ${task_cost:.6f}")
-    print(f"  Total Cost (all tasks): ${total_cost:.6f}")
+
+    s3_line = (
+        f"S3 Location: s3://{get_s3_client().bucket}/{s3_key}\n"
+        if s3_key
+        else ""
+    )
+    cost_lines = ""
     if cost_by_operation:
-        print(f"  Cost by Operation:")
-        for op, cost in cost_by_operation.items():
-            print(f"    - {op}: ${cost:.6f}")
-    
-    print(f"\nNote: Detailed cost logs saved to: logs/cost_tracking.json")
-    
-    print(f"{'='*70}\n")
+        cost_lines = "  Cost by Operation:\n" + "".join(
+            f"    - {op}: ${cost:.6f}\n" for op, cost in cost_by_operation.items()
+        )
+
+    # Walk the report once for its length and word count
+    report_length = len(final_report)
+    word_count = len(final_report.split()) if final_report else 0
+
+    # Print summary as a single write
+    sys.stdout.write(
+        f"\n{BAR}\n"
+        "Execution Summary\n"
+        f"{BAR}\n"
+        f"Task ID: {task_id}\n"
+        f"Query: {user_query}\n"
+        f"Execution Time: {execution_time:.2f} seconds\n"
+        f"Final Report Length: {report_length} characters\n"
+        f"Word Count: {word_count} words\n"
+        f"Confidence Score: {final_state.get('confidence_score', 0.0):.2f}\n"
+        f"Sources Used: {final_state.get('source_count', 0)}\n"
+        f"Error: {error if error else 'None'}\n"
+        f"{s3_line}"
+        "\nCost Information:\n"
+        f"  Task Cost: ${task_cost:.6f}\n"
+        f"  Total Cost (all tasks): ${total_cost:.6f}\n"
+        f"{cost_lines}"
+        "\nNote: Detailed cost logs saved to: logs/cost_tracking.json\n"
+        f"{BAR}\n\n"
+    )
+    sys.stdout.flush()
 
     # Exit with error code if failed
     if error_occurred:
         sys.exit(1)
 
 
+def main():
+    """Synchronous entry point wrapping :func:`amain`."""
+    asyncio.run(amain())
+
+
 if __name__ == "__main__":
     main()
 
@@ -2,7 +2,7 @@
 S3 Bucket Setup Script for aiRA Research Assistant
 """
 
-import boto3
+import argparse
 import os
 from dotenv import load_dotenv
 import sys
@@ -10,8 +10,13 @@ import sys
 # Load environment variables
 load_dotenv()
 
-def setup_s3_bucket():
-    """Create S3 bucket and folder structure"""
+def setup_s3_bucket(create_markers=False):
+    """Create S3 bucket and, optionally, its folder marker objects
+
+    S3 has no real folders; prefixes appear as soon as an object is written
+    under them. Markers are only useful for browsing an empty bucket in the
+    console, so they are skipped unless create_markers is True.
+    """
     
     # Get from environment
     BUCKET_NAME = os.getenv('S3_BUCKET_NAME')
@@ -21,6 +26,11 @@ def setup_s3_bucket():
         print("❌ Error: S3_BUCKET_NAME not set in .env file")
         sys.exit(1)
     
+    # Imported here so a missing bucket name or --help exits without paying
+    # for boto3's import
+    import boto3
+    from botocore.exceptions import ClientError
+    
     print(f"🚀 Setting up S3 bucket: {BUCKET_NAME}")
     print(f"📍 Region: {REGION}\n")
     
@@ -50,6 +60,13 @@ def setup_s3_bucket():
         print(f"❌ Error creating bucket: {e}")
         sys.exit(1)
     
+    # Verify access once before writing anything else
+    try:
+        s3.head_bucket(Bucket=BUCKET_NAME)
+    except ClientError as e:
+        print(f"❌ Cannot access bucket: {e}")
+        sys.exit(1)
+    
     # Create folder structure (bronze/silver/gold layers)
     folders = [
         # Bronze layer (raw data)
@@ -66,13 +83,17 @@ def setup_s3_bucket():
         'reports/'
     ]
     
-    print("\n📁 Creating folder structure:")
-    for folder in folders:
-        try:
-            s3.put_object(Bucket=BUCKET_NAME, Key=folder)
-            print(f"  ✅ {folder}")
-        except Exception as e:
-            print(f"  ❌ Error creating {folder}: {e}")
+    if create_markers:
+        print("\n📁 Creating folder structure:")
+        for folder in folders:
+            try:
+                s3.put_object(Bucket=BUCKET_NAME, Key=folder)
+                print(f"  ✅ {folder}")
+            except Exception as e:
+                print(f"  ❌ Error creating {folder}: {e}")
+    else:
+        print("\nℹ️  Skipping folder markers (not needed for S3 operation)")
+        print("💡 Pass --create-markers to create them for console browsing")
     
     print("\n🎉 S3 setup complete!")
     print(f"\n📊 View your bucket:")
@@ -81,4 +102,12 @@ def setup_s3_bucket():
     return True
 
 if __name__ == "__main__":
-    setup_s3_bucket()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Set up the project S3 bucket")
+    parser.add_argument(
+        "--create-markers",
+        action="store_true",
+        help="Create empty folder marker objects (raw/, processed/, gold/, ...)",
+    )
+    args = parser.parse_args()
+
+    setup_s3_bucket(create_markers=args.create_markers)
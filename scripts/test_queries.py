@@ -4,171 +4,427 @@ Extensive Query Testing Script
 Tests the AI Research Assistant with 10-15 sample queries across different topics.
 This validates the system works correctly with various research questions.
 
+Queries are submitted concurrently over a single pooled HTTP client.
+
 Usage:
     python scripts/test_queries.py --api-url http://localhost:8000
+    python scripts/test_queries.py --api-url http://localhost:8000 --from-schema
 """
 
 import argparse
-import requests
+import asyncio
 import sys
 import time
-import json
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 from datetime import datetime
+from pathlib import Path
+
+import httpx
+import numpy as np
+import orjson
+from tqdm.asyncio import tqdm_asyncio
+
+
+class Query(NamedTuple):
+    """A sample research query"""
+    topic: str
+    query: str
+    depth: str = "standard"
 
 
 # Sample queries across different research topics
-SAMPLE_QUERIES = [
-    {
-        "topic": "Machine Learning",
-        "query": "What are the latest advances in transformer architectures for natural language processing?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Computer Vision",
-        "query": "How do vision transformers compare to convolutional neural networks for image classification?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Reinforcement Learning",
-        "query": "What are the state-of-the-art methods for multi-agent reinforcement learning?",
-        "depth": "standard"
-    },
-    {
-        "topic": "NLP",
-        "query": "How do large language models handle few-shot learning and in-context learning?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Deep Learning",
-        "query": "What are the recent developments in neural architecture search and automated machine learning?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Graph Neural Networks",
-        "query": "What are the latest techniques for learning representations on graph-structured data?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Generative Models",
-        "query": "How do diffusion models compare to GANs for image generation tasks?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Federated Learning",
-        "query": "What are the main challenges and solutions for privacy-preserving federated learning?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Meta-Learning",
-        "query": "What are the current approaches to few-shot learning and meta-learning in deep learning?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Robotics",
-        "query": "How is deep learning being applied to robot control and manipulation tasks?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Explainable AI",
-        "query": "What methods exist for making deep learning models more interpretable and explainable?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Efficient AI",
-        "query": "What are the techniques for creating efficient and lightweight deep learning models?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Causal Inference",
-        "query": "How can causal inference be integrated with machine learning models?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Continual Learning",
-        "query": "What are the approaches to prevent catastrophic forgetting in neural networks?",
-        "depth": "standard"
-    },
-    {
-        "topic": "Multimodal Learning",
-        "query": "How do multimodal models combine vision and language for joint understanding?",
-        "depth": "standard"
-    }
-]
+SAMPLE_QUERIES: Tuple[Query, ...] = (
+    Query(
+        "Machine Learning",
+        "What are the latest advances in transformer architectures for natural language processing?"
+    ),
+    Query(
+        "Computer Vision",
+        "How do vision transformers compare to convolutional neural networks for image classification?"
+    ),
+    Query(
+        "Reinforcement Learning",
+        "What are the state-of-the-art methods for multi-agent reinforcement learning?"
+    ),
+    Query(
+        "NLP",
+        "How do large language models handle few-shot learning and in-context learning?"
+    ),
+    Query(
+        "Deep Learning",
+        "What are the recent developments in neural architecture search and automated machine learning?"
+    ),
+    Query(
+        "Graph Neural Networks",
+        "What are the latest techniques for learning representations on graph-structured data?"
+    ),
+    Query(
+        "Generative Models",
+        "How do diffusion models compare to GANs for image generation tasks?"
+    ),
+    Query(
+        "Federated Learning",
+        "What are the main challenges and solutions for privacy-preserving federated learning?"
+    ),
+    Query(
+        "Meta-Learning",
+        "What are the current approaches to few-shot learning and meta-learning in deep learning?"
+    ),
+    Query(
+        "Robotics",
+        "How is deep learning being applied to robot control and manipulation tasks?"
+    ),
+    Query(
+        "Explainable AI",
+        "What methods exist for making deep learning models more interpretable and explainable?"
+    ),
+    Query(
+        "Efficient AI",
+        "What are the techniques for creating efficient and lightweight deep learning models?"
+    ),
+    Query(
+        "Causal Inference",
+        "How can causal inference be integrated with machine learning models?"
+    ),
+    Query(
+        "Continual Learning",
+        "What are the approaches to prevent catastrophic forgetting in neural networks?"
+    ),
+    Query(
+        "Multimodal Learning",
+        "How do multimodal models combine vision and language for joint understanding?"
+    ),
+)
+
+
+# Default maximum number of HTTP requests in flight at once (--concurrency)
+DEFAULT_CONCURRENCY = 8
+
+# Gates every HTTP call made by the helpers below; resized by run_query_tests
+REQUEST_SLOTS = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+
+# Default ceiling on query submissions per second
+DEFAULT_SUBMIT_RATE = 5.0
+
+
+class RateLimiter:
+    """
+    Async token bucket: allows up to `rate` acquisitions per `period` seconds.
+
+    Only blocks when the bucket is empty, so bursts below the ceiling go out
+    immediately instead of paying a fixed delay per request.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def create_client(api_url: str) -> httpx.AsyncClient:
+    """Create the shared HTTP client (keep-alive pool, HTTP/2 where available)."""
+    return httpx.AsyncClient(
+        base_url=api_url,
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+
+
+# Per-endpoint request latencies in nanoseconds, recorded by the helpers below
+LATENCIES: Dict[str, List[int]] = {"submit": [], "status": [], "report": []}
+
+# Percentiles reported for each endpoint
+LATENCY_PERCENTILES = [50, 75, 95, 99]
+
+
+def summarize_latencies() -> Dict[str, Dict]:
+    """Compute count and p50/p75/p95/p99 (in ms) for each endpoint."""
+    summary = {}
+    for endpoint, samples in LATENCIES.items():
+        if not samples:
+            continue
+        values = np.percentile(np.array(samples) / 1e6, LATENCY_PERCENTILES)
+        summary[endpoint] = {"count": len(samples)}
+        for pct, value in zip(LATENCY_PERCENTILES, values):
+            summary[endpoint][f"p{pct}_ms"] = round(float(value), 2)
+    return summary
 
 
-def submit_query(api_url: str, query: str, depth: str = "standard") -> Tuple[bool, str, Dict]:
+async def submit_query(client: httpx.AsyncClient, query: str, depth: str = "standard") -> Tuple[bool, str, Dict]:
     """Submit a research query and return task_id."""
     try:
-        response = requests.post(
-            f"{api_url}/api/v1/research",
-            json={"query": query, "depth": depth},
-            timeout=10
-        )
+        async with REQUEST_SLOTS:
+            t0 = time.perf_counter_ns()
+            response = await client.post(
+                "/api/v1/research",
+                content=orjson.dumps({"query": query, "depth": depth}),
+                headers={"Content-Type": "application/json"},
+                timeout=10
+            )
+            LATENCIES["submit"].append(time.perf_counter_ns() - t0)
         
         if response.status_code == 201:
-            data = response.json()
+            data = orjson.loads(response.content)
             task_id = data.get("task_id")
             return True, task_id, data
         else:
             return False, None, {"error": f"Status {response.status_code}", "response": response.text}
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return False, None, {"error": str(e)}
 
 
-def check_task_status(api_url: str, task_id: str) -> Tuple[str, Dict]:
-    """Check the status of a task."""
+async def bulk_submit(
+    client: httpx.AsyncClient,
+    queries: Sequence[Query],
+    submit_rate: float = DEFAULT_SUBMIT_RATE
+) -> List[Tuple[bool, str, Dict]]:
+    """
+    Submit all queries concurrently and return their results in order.
+
+    The API has no batch endpoint, so this fans out one POST per query over
+    the shared client. Requests are paced by a RateLimiter on top of the
+    REQUEST_SLOTS concurrency bound so the API is not flooded.
+    """
+    limiter = RateLimiter(submit_rate)
+
+    async def bounded_submit(query_data: Query) -> Tuple[bool, str, Dict]:
+        async with limiter:
+            return await submit_query(client, query_data.query, query_data.depth)
+
+    return await asyncio.gather(*[bounded_submit(q) for q in queries])
+
+
+# Last ETag and parsed status seen per task, for conditional polling
+ETAG_CACHE: Dict[str, str] = {}
+STATUS_CACHE: Dict[str, Tuple[str, Dict]] = {}
+
+
+async def check_task_status(client: httpx.AsyncClient, task_id: str) -> Tuple[str, Dict]:
+    """
+    Check the status of a task.
+
+    Sends If-None-Match when an ETag is known for the task; a 304 reply
+    returns the cached status without re-downloading or re-parsing it.
+    """
+    headers = {}
+    if task_id in ETAG_CACHE:
+        headers["If-None-Match"] = ETAG_CACHE[task_id]
     try:
-        response = requests.get(f"{api_url}/api/v1/status/{task_id}", timeout=5)
+        async with REQUEST_SLOTS:
+            t0 = time.perf_counter_ns()
+            response = await client.get(f"/api/v1/status/{task_id}", headers=headers, timeout=5)
+            LATENCIES["status"].append(time.perf_counter_ns() - t0)
+        if response.status_code == 304 and task_id in STATUS_CACHE:
+            return STATUS_CACHE[task_id]
         if response.status_code == 200:
-            data = response.json()
-            return data.get("status", "unknown"), data
+            data = orjson.loads(response.content)
+            result = (data.get("status", "unknown"), data)
+            etag = response.headers.get("ETag")
+            if etag:
+                ETAG_CACHE[task_id] = etag
+                STATUS_CACHE[task_id] = result
+            return result
         else:
             return "error", {"error": f"Status {response.status_code}"}
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return "error", {"error": str(e)}
 
 
-def wait_for_completion(api_url: str, task_id: str, max_wait: int = 120, poll_interval: int = 5) -> Tuple[str, Dict]:
-    """Wait for a task to complete and return final status."""
+async def wait_for_completion(
+    client: httpx.AsyncClient,
+    task_id: str,
+    max_wait: int = 120,
+    initial_interval: float = 0.5,
+    max_interval: float = 10.0
+) -> Tuple[str, Dict]:
+    """
+    Wait for a task to complete and return final status.
+
+    Polls with exponential backoff: starts at initial_interval and grows by
+    1.5x per poll up to max_interval. If the status response carries an
+    "eta" (seconds remaining), the next poll is scheduled at half of it.
+    """
     start_time = time.time()
+    interval = initial_interval
     
     while time.time() - start_time < max_wait:
-        status, data = check_task_status(api_url, task_id)
+        status, data = await check_task_status(client, task_id)
         
         if status in ["completed", "failed", "rejected"]:
             return status, data
         
-        # Show progress
-        elapsed = int(time.time() - start_time)
-        print(f"      ⏳ Waiting... ({elapsed}s elapsed)", end="\r")
-        time.sleep(poll_interval)
+        eta = data.get("eta")
+        if isinstance(eta, (int, float)):
+            delay = min(max(initial_interval, eta * 0.5), max_interval)
+        else:
+            delay = interval
+            interval = min(interval * 1.5, max_interval)
+        await asyncio.sleep(delay)
     
     # Timeout
     return "timeout", {"error": f"Task did not complete within {max_wait} seconds"}
 
 
-def get_report(api_url: str, task_id: str, format: str = "json") -> Tuple[bool, Dict]:
-    """Retrieve the final report for a completed task."""
+async def wait_for_all(client: httpx.AsyncClient, task_ids: List[str]) -> List[Tuple[str, Dict]]:
+    """
+    Poll all tasks concurrently and return their final statuses in order.
+
+    Progress is shown as a single tqdm bar advanced as tasks finish.
+    """
+    return await tqdm_asyncio.gather(
+        *[wait_for_completion(client, task_id) for task_id in task_ids],
+        desc="   Waiting",
+        unit="task"
+    )
+
+
+# Successful report fetches, keyed by (task_id, format)
+_REPORT_CACHE: Dict[Tuple[str, str], Dict] = {}
+
+
+# Chunk size used when streaming report bodies
+REPORT_CHUNK_SIZE = 65536
+
+
+async def get_report(
+    client: httpx.AsyncClient,
+    task_id: str,
+    format: str = "json",
+    output_path: Optional[Path] = None
+) -> Tuple[bool, Dict]:
+    """
+    Retrieve the final report for a completed task.
+
+    The body is streamed in REPORT_CHUNK_SIZE chunks and its size counted as
+    it arrives. JSON reports are decoded once fully received; other formats
+    are written straight to output_path when one is given instead of being
+    held in memory.
+
+    Successful responses are memoized per (task_id, format); errors are
+    never cached so a later call retries the request.
+    """
+    cache_key = (task_id, format)
+    if cache_key in _REPORT_CACHE:
+        return True, _REPORT_CACHE[cache_key]
+    
     try:
-        response = requests.get(
-            f"{api_url}/api/v1/report/{task_id}?format={format}",
-            timeout=10
-        )
+        async with REQUEST_SLOTS:
+            t0 = time.perf_counter_ns()
+            async with client.stream(
+                "GET",
+                f"/api/v1/report/{task_id}",
+                params={"format": format},
+                timeout=10
+            ) as response:
+                if response.status_code != 200:
+                    LATENCIES["report"].append(time.perf_counter_ns() - t0)
+                    return False, {"error": f"Status {response.status_code}"}
+                
+                size_bytes = 0
+                if format != "json" and output_path is not None:
+                    with open(output_path, "wb") as f:
+                        async for chunk in response.aiter_bytes(REPORT_CHUNK_SIZE):
+                            f.write(chunk)
+                            size_bytes += len(chunk)
+                    LATENCIES["report"].append(time.perf_counter_ns() - t0)
+                    data = {"path": str(output_path), "format": format, "size_bytes": size_bytes}
+                else:
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes(REPORT_CHUNK_SIZE):
+                        body += chunk
+                        size_bytes += len(chunk)
+                    LATENCIES["report"].append(time.perf_counter_ns() - t0)
+                    if format == "json":
+                        data = orjson.loads(body)
+                        data["size_bytes"] = size_bytes
+                        if "report" not in data:
+                            return True, data
+                    else:
+                        data = {"content": body.decode(response.encoding or "utf-8"), "format": format, "size_bytes": size_bytes}
         
-        if response.status_code == 200:
-            if format == "json":
-                return True, response.json()
-            else:
-                return True, {"content": response.text, "format": format}
-        else:
-            return False, {"error": f"Status {response.status_code}"}
-    except requests.exceptions.RequestException as e:
+        _REPORT_CACHE[cache_key] = data
+        return True, data
+    except httpx.HTTPError as e:
         return False, {"error": str(e)}
 
 
-def run_query_tests(api_url: str, queries: List[Dict], wait_for_completion: bool = False) -> Dict:
+def _resolve_schema(spec: Dict, schema: Dict) -> Dict:
+    """Follow a local "#/components/..." $ref in an OpenAPI document."""
+    while "$ref" in schema:
+        node = spec
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node[part]
+        schema = {**node, **{k: v for k, v in schema.items() if k != "$ref"}}
+    return schema
+
+
+async def load_query_matrix(api_url: str) -> Tuple[Query, ...]:
+    """
+    Build the query matrix from the live API's OpenAPI schema.
+
+    Every sample query is paired with each depth the research endpoint
+    accepts and clipped to its query length limits, so the matrix follows
+    the API as it evolves. Falls back to SAMPLE_QUERIES when the schema is
+    unavailable or not in the expected shape.
+    """
+    try:
+        async with create_client(api_url) as client:
+            response = await client.get("/openapi.json")
+            response.raise_for_status()
+        spec = orjson.loads(response.content)
+        
+        body = spec["paths"]["/api/v1/research"]["post"]["requestBody"]
+        request_schema = _resolve_schema(spec, body["content"]["application/json"]["schema"])
+        properties = request_schema["properties"]
+        query_schema = _resolve_schema(spec, properties["query"])
+        depths = _resolve_schema(spec, properties["depth"]).get("enum", ["standard"])
+    except (httpx.HTTPError, orjson.JSONDecodeError, KeyError, TypeError) as e:
+        print(f"⚠️  Could not load OpenAPI schema ({e}); using built-in sample queries")
+        return SAMPLE_QUERIES
+    
+    min_length = query_schema.get("minLength", 0)
+    max_length = query_schema.get("maxLength")
+    
+    matrix = []
+    for sample in SAMPLE_QUERIES:
+        query = sample.query[:max_length] if max_length else sample.query
+        if len(query) < min_length:
+            continue
+        for depth in depths:
+            matrix.append(Query(sample.topic, query, depth))
+    
+    print(f"📐 Generated {len(matrix)} queries from the OpenAPI schema ({len(depths)} depths)")
+    return tuple(matrix) or SAMPLE_QUERIES
+
+
+async def run_query_tests(
+    api_url: str,
+    queries: Sequence[Query],
+    wait: bool = False,
+    submit_rate: float = DEFAULT_SUBMIT_RATE,
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> Dict:
     """Run tests for all queries."""
+    global REQUEST_SLOTS
+    REQUEST_SLOTS = asyncio.Semaphore(concurrency)
+    
     results = {
         "total": len(queries),
         "submitted": 0,
@@ -182,73 +438,75 @@ def run_query_tests(api_url: str, queries: List[Dict], wait_for_completion: bool
     print("=" * 70)
     print(f"Testing {len(queries)} queries across different research topics\n")
     
-    for i, query_data in enumerate(queries, 1):
-        topic = query_data["topic"]
-        query = query_data["query"]
-        depth = query_data.get("depth", "standard")
+    async with create_client(api_url) as client:
+        submissions = await bulk_submit(client, queries, submit_rate)
         
-        print(f"\n[{i}/{len(queries)}] Testing: {topic}")
-        print(f"   Query: {query[:60]}...")
+        # Tasks to poll once every submission has been reported
+        pending = []
         
-        # Submit query
-        success, task_id, submit_data = submit_query(api_url, query, depth)
-        
-        query_result = {
-            "topic": topic,
-            "query": query,
-            "submitted": success,
-            "task_id": task_id,
-            "final_status": None,
-            "has_report": False,
-            "error": None
-        }
-        
-        if not success:
-            print(f"   ❌ Failed to submit: {submit_data.get('error', 'Unknown error')}")
-            results["failed"] += 1
-            query_result["error"] = submit_data.get("error")
+        for i, (query_data, (success, task_id, submit_data)) in enumerate(zip(queries, submissions), 1):
+            topic = query_data.topic
+            query = query_data.query
+            
+            print(f"\n[{i}/{len(queries)}] Testing: {topic}")
+            print(f"   Query: {query[:60]}...")
+            
+            query_result = {
+                "topic": topic,
+                "query": query,
+                "submitted": success,
+                "task_id": task_id,
+                "final_status": None,
+                "has_report": False,
+                "error": None
+            }
             results["queries"].append(query_result)
-            continue
-        
-        results["submitted"] += 1
-        print(f"   ✅ Submitted successfully (Task ID: {task_id[:8]}...)")
-        
-        if wait_for_completion:
-            # Wait for task to complete
-            print(f"   ⏳ Waiting for completion...")
-            status, status_data = wait_for_completion(api_url, task_id)
-            query_result["final_status"] = status
             
-            if status == "completed":
-                results["completed"] += 1
-                print(f"   ✅ Task completed successfully")
-                
-                # Try to get report
-                success, report_data = get_report(api_url, task_id)
-                if success:
-                    query_result["has_report"] = True
-                    if "report" in report_data:
-                        report_length = len(report_data.get("report", ""))
-                        print(f"   📄 Report generated ({report_length} characters)")
-            elif status == "failed":
+            if not success:
+                print(f"   ❌ Failed to submit: {submit_data.get('error', 'Unknown error')}")
                 results["failed"] += 1
-                print(f"   ❌ Task failed")
-                query_result["error"] = status_data.get("error", "Unknown error")
-            elif status == "timeout":
-                results["timeout"] += 1
-                print(f"   ⏱️  Task timed out")
-                query_result["error"] = "Timeout"
-        else:
-            # Just submit, don't wait
-            status, _ = check_task_status(api_url, task_id)
-            query_result["final_status"] = status
-            print(f"   ℹ️  Task status: {status} (not waiting for completion)")
-        
-        results["queries"].append(query_result)
+                query_result["error"] = submit_data.get("error")
+                continue
+            
+            results["submitted"] += 1
+            print(f"   ✅ Submitted successfully (Task ID: {task_id[:8]}...)")
+            
+            if wait:
+                pending.append(query_result)
+            else:
+                # Just submit, don't wait; the submit response carries the initial status
+                status = submit_data.get("status", "submitted")
+                query_result["final_status"] = status
+                print(f"   ℹ️  Task status: {status} (not waiting for completion)")
         
-        # Small delay between queries to avoid overwhelming the API
-        if i < len(queries):
-            time.sleep(2)
+        if pending:
+            # Poll every in-flight task at once
+            print(f"\n⏳ Waiting for {len(pending)} task(s) to complete...")
+            outcomes = await wait_for_all(client, [r["task_id"] for r in pending])
+            
+            for query_result, (status, status_data) in zip(pending, outcomes):
+                task_id = query_result["task_id"]
+                query_result["final_status"] = status
+                print(f"\n[{query_result['topic']}] Task {task_id[:8]}...")
+                
+                if status == "completed":
+                    results["completed"] += 1
+                    print(f"   ✅ Task completed successfully")
+                    
+                    # Try to get report
+                    success, report_data = await get_report(client, task_id)
+                    if success:
+                        query_result["has_report"] = True
+                        if "report" in report_data:
+                            print(f"   📄 Report generated ({report_data['size_bytes']} bytes)")
+                elif status == "failed":
+                    results["failed"] += 1
+                    print(f"   ❌ Task failed")
+                    query_result["error"] = status_data.get("error", "Unknown error")
+                elif status == "timeout":
+                    results["timeout"] += 1
+                    print(f"   ⏱️  Task timed out")
+                    query_result["error"] = "Timeout"
     
     # Summary
     print("\n" + "=" * 70)
@@ -256,15 +514,28 @@ def run_query_tests(api_url: str, queries: List[Dict], wait_for_completion: bool
     print("=" * 70)
     print(f"Total Queries:      {results['total']}")
     print(f"Successfully Submitted: {results['submitted']} ✅")
-    if wait_for_completion:
+    if wait:
         print(f"Completed:          {results['completed']} ✅")
         print(f"Failed:             {results['failed']} ❌")
         print(f"Timed Out:          {results['timeout']} ⏱️")
     
+    results["latency_ms"] = summarize_latencies()
+    if results["latency_ms"]:
+        print("\n⏱️  Latency (ms):")
+        for endpoint, stats in results["latency_ms"].items():
+            print(
+                f"   {endpoint:<7} n={stats['count']:<4} "
+                f"p50={stats['p50_ms']:<8} p75={stats['p75_ms']:<8} "
+                f"p95={stats['p95_ms']:<8} p99={stats['p99_ms']}"
+            )
+    
     # Save results to file
     output_file = f"query_test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    # Write off the event loop so a shared loop is never blocked on disk I/O
+    await asyncio.to_thread(
+        Path(output_file).write_bytes,
+        orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    )
     
     print(f"\n💾 Detailed results saved to: {output_file}")
     
@@ -284,7 +555,24 @@ def main():
     parser.add_argument(
         "--wait",
         action="store_true",
-        help="Wait for each query to complete before moving to the next"
+        help="Wait for all submitted queries to complete"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum HTTP requests in flight at once (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_SUBMIT_RATE,
+        help=f"Maximum query submissions per second (default: {DEFAULT_SUBMIT_RATE:g})"
+    )
+    parser.add_argument(
+        "--from-schema",
+        action="store_true",
+        help="Build the query matrix from the API's /openapi.json (every sample query at every depth)"
     )
     parser.add_argument(
         "--num-queries",
@@ -295,11 +583,16 @@ def main():
     
     args = parser.parse_args()
     
-    queries = SAMPLE_QUERIES
+    if args.from_schema:
+        queries = asyncio.run(load_query_matrix(args.api_url))
+    else:
+        queries = SAMPLE_QUERIES
     if args.num_queries:
         queries = queries[:args.num_queries]
     
-    results = run_query_tests(args.api_url, queries, args.wait)
+    results = asyncio.run(
+        run_query_tests(args.api_url, queries, args.wait, args.rate, args.concurrency)
+    )
     
     # Exit code based on success rate
     if results["submitted"] == results["total"]:
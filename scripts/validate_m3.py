@@ -9,42 +9,97 @@ Comprehensive validation script that checks all M3 requirements:
 - Output quality
 
 Usage:
-    python scripts/validate_m3.py
+    python scripts/validate_m3.py                # full (default)
+    python scripts/validate_m3.py --mode live    # environment only, no LLM calls
+    python scripts/validate_m3.py --mode ready   # environment + agent tests
 """
 
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import importlib.util
 import os
+import re
 import sys
 import time
 import json
-import uuid
+import secrets
+import threading
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Any, Optional
 from datetime import datetime
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# Import all necessary modules
+# Only lightweight modules are imported here; the workflow, SDK clients and
+# numpy are imported inside the checks that use them so --mode live does not
+# pay for loading the agent graph
 try:
-    from src.agents.workflow import compiled_workflow
+    from dotenv import load_dotenv
     from src.agents.state import ResearchState
-    from src.agents.search_agent import search_agent_node
-    from src.agents.synthesis_agent import synthesis_agent_node
-    from src.agents.validation_agent import validation_agent_node
-    from src.agents.hitl_review import hitl_review_node
-    from src.utils.openai_client import OpenAIClient
-    from src.utils.pinecone_rag import semantic_search, query_to_embedding
-    from src.utils.s3_client import S3Client
-    from src.utils.cost_tracker import get_cost_tracker
     from src.utils.logger import get_logger
 except ImportError as e:
     print(f"ERROR: Failed to import required modules: {e}")
     sys.exit(1)
 
+# Load .env here; the client modules that used to do it are now imported lazily
+load_dotenv()
+
+if TYPE_CHECKING:
+    from src.utils.s3_client import S3Client
+
+# orjson is much faster than json for the report dump; fall back if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Environment variables check_environment expects
+REQUIRED_ENV_VARS = ("OPENAI_API_KEY", "PINECONE_API_KEY", "PINECONE_INDEX_NAME", "S3_BUCKET_NAME")
+
+# Deadlines (seconds) for each environment probe and the full workflow run
+PROBE_TIMEOUT = 5
+WORKFLOW_TIMEOUT = 120
+# Separate, looser deadline for probe warm-up (SDK imports, client setup and
+# the first-run probe embedding) so a cold start is not reported as a failure
+WARMUP_TIMEOUT = 60
+
+# Timestamp for this validation run, reused for every stamp it writes
+RUN_TS = datetime.now()
+RUN_TS_ISO = RUN_TS.isoformat()
+
 # Setup logging
 logger = get_logger(__name__, log_file="validate_m3", console=True, file=False)
 
+
+@functools.lru_cache(maxsize=1)
+def _get_s3() -> S3Client:
+    """Shared S3 client with a pooled, keep-alive connection and adaptive retries."""
+    from botocore.config import Config
+    from src.utils.s3_client import S3Client
+    
+    return S3Client(
+        config=Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={"mode": "adaptive"},
+        )
+    )
+
+# Section keywords used to score report structure in check_quality
+_STRUCTURE_RE = re.compile(
+    r"introduction|overview|summary|findings|results|discoveries|conclusion|concluding"
+)
+
+# Inline citations such as "[Source 3]"
+_CITATION_RE = re.compile(r"\[Source[^\]]*\]")
+
 # Test results storage
 test_results: Dict[str, List[Tuple[str, bool, Optional[str]]]] = {
     "environment": [],
@@ -54,6 +109,9 @@ test_results: Dict[str, List[Tuple[str, bool, Optional[str]]]] = {
     "quality": [],
 }
 
+# Bound append methods for each known category
+_APPENDERS = {category: tests.append for category, tests in test_results.items()}
+
 
 def print_test_result(category: str, test_name: str, passed: bool, message: Optional[str] = None):
     """Print test result with checkmark or X."""
@@ -66,133 +124,252 @@ def print_test_result(category: str, test_name: str, passed: bool, message: Opti
     else:
         print()
     
-    # Ensure category exists in test_results
-    if category not in test_results:
-        test_results[category] = []
-    test_results[category].append((test_name, passed, message))
+    # Unknown categories get a new list in test_results
+    appender = _APPENDERS.get(category) or test_results.setdefault(category, []).append
+    appender((test_name, passed, message))
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_vector() -> List[float]:
+    """
+    Embedding used to probe Pinecone.
+
+    Cached under temp/ so only the first validation run pays for an OpenAI
+    embedding call; later runs reuse the stored vector. The file name carries
+    the embedding model and dimension, and a stored vector of the wrong
+    length is re-embedded, so a model change never sends a stale vector.
+    """
+    import numpy as np
+    from src.utils.pinecone_rag import EMBEDDING_DIMENSION, EMBEDDING_MODEL, query_to_embedding
+    
+    cache_file = project_root / "temp" / f"pinecone_probe_vector_{EMBEDDING_MODEL}_{EMBEDDING_DIMENSION}.npy"
+    if cache_file.exists():
+        vector = np.load(cache_file)
+        if vector.shape == (EMBEDDING_DIMENSION,):
+            return vector.tolist()
+    
+    vector = query_to_embedding("pinecone health probe")
+    cache_file.parent.mkdir(exist_ok=True)
+    np.save(cache_file, np.asarray(vector, dtype=np.float32))
+    return vector
+
+
+def _in_daemon_thread(fn, *args) -> Future:
+    """
+    Run fn in a daemon thread and return a Future for its result.
+
+    ThreadPoolExecutor workers are joined at interpreter exit, so a hung
+    boto3/Pinecone/OpenAI call would keep the process alive after its check
+    had already timed out. Daemon threads are abandoned instead.
+    """
+    future: Future = Future()
+    
+    def runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=runner, name=getattr(fn, "__name__", "probe"), daemon=True).start()
+    return future
+
+
+def _warm_pinecone():
+    """Import the Pinecone helpers, open the index and load the probe vector."""
+    from src.utils.pinecone_rag import _get_pinecone_index
+    
+    _get_pinecone_index()
+    _probe_vector()
+
+
+def _probe_pinecone():
+    """Run a one-result query against the research_papers namespace."""
+    from src.utils.pinecone_rag import _get_pinecone_index
+    
+    _get_pinecone_index().query(
+        vector=_probe_vector(), top_k=1, namespace="research_papers"
+    )
 
 
-def check_environment():
+def _probe_s3_read(s3_client: S3Client):
+    """List a single object to confirm read access."""
+    s3_client.list_objects(prefix="bronze/", max_keys=1)
+
+
+def _probe_s3_write(s3_client: S3Client):
+    """Upload and delete a small test object to confirm write access."""
+    test_key = f"test/validate_m3_{secrets.token_hex(4)}.txt"
+    test_content = f"Validation test - {RUN_TS_ISO}"
+    
+    if not s3_client.put_bytes(test_key, test_content.encode()):
+        raise RuntimeError("Upload failed")
+    # Clean up test file
+    try:
+        s3_client.delete_object(test_key)
+    except:
+        pass
+
+
+async def check_environment():
     """1. Environment Check"""
     print("\n" + "=" * 70)
     print("1. ENVIRONMENT CHECK")
     print("=" * 70)
     
+    # Network probes are independent, so they are collected as
+    # (test name, coroutine) pairs and run concurrently at the end. Each runs
+    # in a daemon thread with a PROBE_TIMEOUT deadline that starts after its
+    # optional warm-up, so a hung SDK call cannot stall the report or exit.
+    probes = []
+    
+    async def run_probe(fn, *args, warmup=None):
+        if warmup is not None:
+            try:
+                await asyncio.wait_for(asyncio.wrap_future(_in_daemon_thread(warmup)), WARMUP_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise RuntimeError(f"Warm-up timed out after {WARMUP_TIMEOUT}s") from None
+        return await asyncio.wait_for(asyncio.wrap_future(_in_daemon_thread(fn, *args)), PROBE_TIMEOUT)
+    
+    env = os.environ
+    missing = [key for key in REQUIRED_ENV_VARS if not env.get(key)]
+    if missing:
+        print(f"Missing environment variables: {', '.join(missing)}")
+    else:
+        print("All required environment variables are set")
+    
     # Check OpenAI API key
-    openai_key = os.getenv("OPENAI_API_KEY")
+    openai_key = env.get("OPENAI_API_KEY")
     if openai_key and openai_key.startswith("sk-"):
         print_test_result("environment", "OpenAI API key configured", True)
     else:
         print_test_result("environment", "OpenAI API key configured", False, "OPENAI_API_KEY not set or invalid")
     
     # Check Pinecone configuration
-    pinecone_key = os.getenv("PINECONE_API_KEY")
-    pinecone_index = os.getenv("PINECONE_INDEX_NAME")
+    pinecone_key = env.get("PINECONE_API_KEY")
+    pinecone_index = env.get("PINECONE_INDEX_NAME")
     if pinecone_key and pinecone_index:
         print_test_result("environment", "Pinecone API key configured", True)
         print_test_result("environment", "Pinecone index name configured", True)
         
         # Test Pinecone connectivity
-        try:
-            results = semantic_search("test query", top_k=1, namespace="research_papers")
-            print_test_result("environment", "Pinecone index accessible", True)
-        except Exception as e:
-            print_test_result("environment", "Pinecone index accessible", False, str(e))
+        probes.append(("Pinecone index accessible", run_probe(_probe_pinecone, warmup=_warm_pinecone)))
     else:
         print_test_result("environment", "Pinecone API key configured", False, "PINECONE_API_KEY not set")
         print_test_result("environment", "Pinecone index name configured", False, "PINECONE_INDEX_NAME not set")
         print_test_result("environment", "Pinecone index accessible", False, "Cannot test without credentials")
     
     # Check S3 configuration
-    s3_bucket = os.getenv("S3_BUCKET_NAME")
+    s3_bucket = env.get("S3_BUCKET_NAME")
     if s3_bucket:
         print_test_result("environment", "S3 bucket name configured", True)
         
-        # Test S3 connectivity
+        # Test S3 connectivity (read and write)
         try:
-            s3_client = S3Client()
-            # Try to list objects (read test)
-            try:
-                s3_client.list_objects(prefix="bronze/", max_keys=1)
-                print_test_result("environment", "S3 bucket readable", True)
-            except Exception as e:
-                print_test_result("environment", "S3 bucket readable", False, str(e))
-            
-            # Try to upload a test file (write test)
-            try:
-                test_key = f"test/validate_m3_{uuid.uuid4().hex[:8]}.txt"
-                test_content = f"Validation test - {datetime.now().isoformat()}"
-                temp_file = project_root / "temp" / "test_upload.txt"
-                temp_file.parent.mkdir(exist_ok=True)
-                temp_file.write_text(test_content)
-                
-                success = s3_client.upload_file(str(temp_file), test_key)
-                if success:
-                    print_test_result("environment", "S3 bucket writable", True)
-                    # Clean up test file
-                    try:
-                        s3_client.delete_object(test_key)
-                    except:
-                        pass
-                else:
-                    print_test_result("environment", "S3 bucket writable", False, "Upload failed")
-                temp_file.unlink(missing_ok=True)
-            except Exception as e:
-                print_test_result("environment", "S3 bucket writable", False, str(e))
+            s3_client = _get_s3()
         except Exception as e:
             print_test_result("environment", "S3 bucket readable", False, str(e))
             print_test_result("environment", "S3 bucket writable", False, str(e))
+        else:
+            probes.append(("S3 bucket readable", run_probe(_probe_s3_read, s3_client)))
+            probes.append(("S3 bucket writable", run_probe(_probe_s3_write, s3_client)))
     else:
         print_test_result("environment", "S3 bucket name configured", False, "S3_BUCKET_NAME not set")
         print_test_result("environment", "S3 bucket readable", False, "Cannot test without bucket name")
         print_test_result("environment", "S3 bucket writable", False, "Cannot test without bucket name")
     
-    # Check dependencies
+    results = await asyncio.gather(*(coro for _, coro in probes), return_exceptions=True)
+    for (test_name, _), result in zip(probes, results):
+        if isinstance(result, asyncio.TimeoutError):
+            print_test_result("environment", test_name, False, f"Timed out after {PROBE_TIMEOUT}s")
+        elif isinstance(result, Exception):
+            print_test_result("environment", test_name, False, str(result))
+        else:
+            print_test_result("environment", test_name, True)
+    
+    # Check dependencies (find_spec locates each package without importing it)
     required_modules = [
         "openai", "pinecone", "boto3", "langgraph", "tiktoken", "tqdm"
     ]
     for module in required_modules:
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print_test_result("environment", f"Dependency '{module}' installed", True)
-        except ImportError:
+        else:
             print_test_result("environment", f"Dependency '{module}' installed", False, "Module not found")
 
 
-def check_agents():
+# Graph nodes whose output states check_agents inspects, in execution order
+AGENT_NODES = ("search", "synthesis", "validation")
+
+
+async def _run_agent_nodes(initial_state: ResearchState, states: Dict[str, ResearchState]):
+    """
+    Drive the compiled workflow and capture each agent node's output state.
+
+    Outputs are recorded into `states` as they arrive (so earlier nodes are
+    kept if a later one raises) and the stream is closed once validation
+    finishes; routing past that point is left to the integration test.
+    """
+    from src.agents.workflow import compiled_workflow
+    
+    events = compiled_workflow.astream_events(initial_state, version="v2")
+    async with contextlib.aclosing(events):
+        async for event in events:
+            name = event["name"]
+            if (
+                event["event"] == "on_chain_end"
+                and name in AGENT_NODES
+                and event["metadata"].get("langgraph_node") == name
+            ):
+                states[name] = event["data"]["output"]
+                if name == AGENT_NODES[-1]:
+                    break
+
+
+async def check_agents():
     """2. Agent Tests"""
     print("\n" + "=" * 70)
     print("2. AGENT TESTS")
     print("=" * 70)
     
-    task_id = f"validate_m3_{uuid.uuid4().hex[:8]}"
+    task_id = f"validate_m3_{secrets.token_hex(4)}"
     test_query = "What are attention mechanisms in transformers?"
     
+    # One state threads through every agent; each test reads from it and a
+    # step that did not run simply leaves it as it was
+    state: ResearchState = {
+        "task_id": task_id,
+        "user_query": test_query,
+        "current_agent": "search",
+        "search_queries": [],
+        "search_results": [],
+        "retrieved_chunks": [],
+        "report_draft": "",
+        "validation_result": {},
+        "confidence_score": 0.0,
+        "needs_hitl": False,
+        "final_report": "",
+        "error": None,
+    }
+    
+    # Run search -> synthesis -> validation through the production graph
+    states: Dict[str, ResearchState] = {}
+    run_error = None
+    try:
+        await _run_agent_nodes(state, states)
+    except Exception as e:
+        run_error = str(e)
+    
     # Test Search Agent
     print("\n--- Testing Search Agent ---")
-    try:
-        initial_state: ResearchState = {
-            "task_id": task_id,
-            "user_query": test_query,
-            "current_agent": "search",
-            "search_queries": [],
-            "search_results": [],
-            "retrieved_chunks": [],
-            "report_draft": "",
-            "validation_result": {},
-            "confidence_score": 0.0,
-            "needs_hitl": False,
-            "final_report": "",
-            "error": None,
-        }
+    if "search" in states:
+        state = states["search"]
         
-        result_state = search_agent_node(initial_state)
-        
-        if result_state.get("error"):
-            print_test_result("agents", "Search agent generates valid queries", False, result_state["error"])
+        if state.get("error"):
+            print_test_result("agents", "Search agent generates valid queries", False, state["error"])
         else:
-            queries = result_state.get("search_queries", [])
-            results = result_state.get("search_results", [])
+            queries, results = state.get("search_queries", []), state.get("search_results", [])
             
             if len(queries) >= 3 and len(queries) <= 5:
                 print_test_result("agents", "Search agent generates valid queries", True, f"Generated {len(queries)} queries")
@@ -203,87 +380,83 @@ def check_agents():
                 print_test_result("agents", "Search agent returns results", True, f"Found {len(results)} results")
             else:
                 print_test_result("agents", "Search agent returns results", False, "No results returned")
-    except Exception as e:
-        print_test_result("agents", "Search agent generates valid queries", False, str(e))
-        print_test_result("agents", "Search agent returns results", False, str(e))
-        result_state = initial_state
+    else:
+        message = run_error or "Search agent did not run"
+        print_test_result("agents", "Search agent generates valid queries", False, message)
+        print_test_result("agents", "Search agent returns results", False, message)
     
     # Test Synthesis Agent
     print("\n--- Testing Synthesis Agent ---")
-    try:
-        if result_state.get("search_results"):
-            synthesis_state = synthesis_agent_node(result_state)
+    if "synthesis" in states:
+        state = states["synthesis"]
+        
+        if state.get("error"):
+            print_test_result("agents", "Synthesis agent produces report", False, state["error"])
+        else:
+            report, sources = state.get("report_draft", ""), state.get("source_count", 0)
             
-            if synthesis_state.get("error"):
-                print_test_result("agents", "Synthesis agent produces report", False, synthesis_state["error"])
+            if report and len(report) > 100:
+                print_test_result("agents", "Synthesis agent produces report", True, f"Report length: {len(report)} chars")
             else:
-                report = synthesis_state.get("report_draft", "")
-                sources = synthesis_state.get("source_count", 0)
-                
-                if report and len(report) > 100:
-                    print_test_result("agents", "Synthesis agent produces report", True, f"Report length: {len(report)} chars")
-                else:
-                    print_test_result("agents", "Synthesis agent produces report", False, "Report too short or empty")
-                
-                if "[Source" in report:
-                    print_test_result("agents", "Synthesis agent includes citations", True)
-                else:
-                    print_test_result("agents", "Synthesis agent includes citations", False, "No citations found in report")
-                
-                if sources > 0:
-                    print_test_result("agents", "Synthesis agent uses sources", True, f"Used {sources} sources")
-                else:
-                    print_test_result("agents", "Synthesis agent uses sources", False, "No sources used")
-        else:
-            print_test_result("agents", "Synthesis agent produces report", False, "No search results available")
-            synthesis_state = result_state
-    except Exception as e:
-        print_test_result("agents", "Synthesis agent produces report", False, str(e))
-        synthesis_state = result_state
+                print_test_result("agents", "Synthesis agent produces report", False, "Report too short or empty")
+            
+            if "[Source" in report:
+                print_test_result("agents", "Synthesis agent includes citations", True)
+            else:
+                print_test_result("agents", "Synthesis agent includes citations", False, "No citations found in report")
+            
+            if sources > 0:
+                print_test_result("agents", "Synthesis agent uses sources", True, f"Used {sources} sources")
+            else:
+                print_test_result("agents", "Synthesis agent uses sources", False, "No sources used")
+    elif not state.get("search_results"):
+        print_test_result("agents", "Synthesis agent produces report", False, "No search results available")
+    else:
+        print_test_result("agents", "Synthesis agent produces report", False, run_error or "Synthesis agent did not run")
     
     # Test Validation Agent
     print("\n--- Testing Validation Agent ---")
-    try:
-        if synthesis_state.get("report_draft"):
-            validation_state = validation_agent_node(synthesis_state)
+    if "validation" in states:
+        state = states["validation"]
+        
+        if state.get("error"):
+            print_test_result("agents", "Validation agent calculates confidence", False, state["error"])
+        else:
+            confidence = state.get("confidence_score", 0.0)
+            needs_hitl = state.get("needs_hitl", False)
+            validation_result = state.get("validation_result", {})
             
-            if validation_state.get("error"):
-                print_test_result("agents", "Validation agent calculates confidence", False, validation_state["error"])
+            if 0.0 <= confidence <= 1.0:
+                print_test_result("agents", "Validation agent calculates confidence", True, f"Confidence: {confidence:.2f}")
             else:
-                confidence = validation_state.get("confidence_score", 0.0)
-                needs_hitl = validation_state.get("needs_hitl", False)
-                validation_result = validation_state.get("validation_result", {})
-                
-                if 0.0 <= confidence <= 1.0:
-                    print_test_result("agents", "Validation agent calculates confidence", True, f"Confidence: {confidence:.2f}")
-                else:
-                    print_test_result("agents", "Validation agent calculates confidence", False, f"Invalid confidence: {confidence}")
-                
-                if isinstance(needs_hitl, bool):
-                    print_test_result("agents", "Validation agent sets needs_hitl flag", True, f"needs_hitl={needs_hitl}")
-                else:
-                    print_test_result("agents", "Validation agent sets needs_hitl flag", False, "needs_hitl not boolean")
-                
-                if validation_result:
-                    print_test_result("agents", "Validation agent returns validation result", True)
-                else:
-                    print_test_result("agents", "Validation agent returns validation result", False, "Empty validation result")
-        else:
-            print_test_result("agents", "Validation agent calculates confidence", False, "No report draft available")
-            validation_state = synthesis_state
-    except Exception as e:
-        print_test_result("agents", "Validation agent calculates confidence", False, str(e))
-        validation_state = synthesis_state
+                print_test_result("agents", "Validation agent calculates confidence", False, f"Invalid confidence: {confidence}")
+            
+            if isinstance(needs_hitl, bool):
+                print_test_result("agents", "Validation agent sets needs_hitl flag", True, f"needs_hitl={needs_hitl}")
+            else:
+                print_test_result("agents", "Validation agent sets needs_hitl flag", False, "needs_hitl not boolean")
+            
+            if validation_result:
+                print_test_result("agents", "Validation agent returns validation result", True)
+            else:
+                print_test_result("agents", "Validation agent returns validation result", False, "Empty validation result")
+    elif not state.get("report_draft"):
+        print_test_result("agents", "Validation agent calculates confidence", False, "No report draft available")
+    else:
+        print_test_result("agents", "Validation agent calculates confidence", False, run_error or "Validation agent did not run")
     
-    # Test HITL Review
+    # Test HITL Review (called directly so the auto-approve path is exercised
+    # whatever confidence validation produced, without an interactive prompt)
     print("\n--- Testing HITL Review ---")
     try:
-        if validation_state.get("report_draft"):
+        from src.agents.hitl_review import hitl_review_node
+        
+        if state.get("report_draft"):
             # Test with needs_hitl=False (auto-approve)
-            validation_state["needs_hitl"] = False
-            hitl_state = hitl_review_node(validation_state)
+            state = {**state, "needs_hitl": False}
+            state = {**state, **hitl_review_node(state)}
             
-            if hitl_state.get("final_report"):
+            if state.get("final_report"):
                 print_test_result("agents", "HITL workflow functions (auto-approve)", True)
             else:
                 print_test_result("agents", "HITL workflow functions (auto-approve)", False, "final_report not set")
@@ -299,10 +472,13 @@ def check_integration():
     print("3. INTEGRATION TESTS")
     print("=" * 70)
     
-    task_id = f"validate_m3_integration_{uuid.uuid4().hex[:8]}"
+    task_id = f"validate_m3_integration_{secrets.token_hex(4)}"
     test_query = "What are recent advances in transformer architectures?"
     
     try:
+        from src.agents.workflow import compiled_workflow
+        from src.utils.cost_tracker import get_cost_tracker
+        
         # Initialize state
         initial_state: ResearchState = {
             "task_id": task_id,
@@ -327,7 +503,13 @@ def check_integration():
         print(f"\nRunning full workflow with query: '{test_query}'")
         start_time = time.time()
         
-        final_state = compiled_workflow.invoke(initial_state)
+        # Run in a daemon thread so a hung LLM or Pinecone call fails the
+        # check after WORKFLOW_TIMEOUT instead of blocking validation or exit
+        try:
+            final_state = _in_daemon_thread(compiled_workflow.invoke, initial_state).result(timeout=WORKFLOW_TIMEOUT)
+        except FuturesTimeoutError:
+            print_test_result("integration", "Full workflow runs end-to-end", False, f"Timed out after {WORKFLOW_TIMEOUT}s")
+            return None, WORKFLOW_TIMEOUT
         
         execution_time = time.time() - start_time
         
@@ -349,7 +531,7 @@ def check_integration():
         final_report = final_state.get("final_report", "")
         if final_report:
             try:
-                s3_client = S3Client()
+                s3_client = _get_s3()
                 bucket = s3_client.bucket
                 if bucket:
                     # Check if report would be saved (we don't actually save in validation)
@@ -380,7 +562,24 @@ def check_integration():
         return None, 0
 
 
-def check_performance(final_state: Optional[ResearchState], execution_time: float):
+def _report_text(final_state: Optional[ResearchState]) -> str:
+    """Final report, falling back to the draft."""
+    if not final_state:
+        return ""
+    return final_state.get("final_report", "") or final_state.get("report_draft", "")
+
+
+def _scan_citations(report: str) -> Dict[str, Any]:
+    """Find every inline citation once; shared by the performance and quality checks."""
+    matches = _CITATION_RE.findall(report)
+    return {"count": len(matches), "ids": set(matches)}
+
+
+def check_performance(
+    final_state: Optional[ResearchState],
+    execution_time: float,
+    citations: Optional[Dict[str, Any]] = None,
+):
     """4. Performance Checks"""
     print("\n" + "=" * 70)
     print("4. PERFORMANCE CHECKS")
@@ -401,6 +600,8 @@ def check_performance(final_state: Optional[ResearchState], execution_time: floa
     
     # Check cost
     try:
+        from src.utils.cost_tracker import get_cost_tracker
+        
         task_id = final_state.get("task_id", "")
         cost_tracker = get_cost_tracker()
         task_cost = cost_tracker.get_query_cost(task_id)
@@ -415,7 +616,7 @@ def check_performance(final_state: Optional[ResearchState], execution_time: floa
     
     # Check citation accuracy
     try:
-        report = final_state.get("final_report", "") or final_state.get("report_draft", "")
+        report = _report_text(final_state)
         validation_result = final_state.get("validation_result", {})
         
         if report and validation_result:
@@ -423,7 +624,9 @@ def check_performance(final_state: Optional[ResearchState], execution_time: floa
             citation_coverage = validation_result.get("citation_coverage", 0.0)
             
             # Calculate accuracy (1 - invalid_citation_rate)
-            total_citations = report.count("[Source")
+            if citations is None:
+                citations = _scan_citations(report)
+            total_citations = citations["count"]
             if total_citations > 0:
                 invalid_rate = len(invalid_citations) / total_citations
                 accuracy = (1 - invalid_rate) * 100
@@ -444,7 +647,10 @@ def check_performance(final_state: Optional[ResearchState], execution_time: floa
         print_test_result("performance", "Citation accuracy > 85%", False, str(e))
 
 
-def check_quality(final_state: Optional[ResearchState]):
+def check_quality(
+    final_state: Optional[ResearchState],
+    citations: Optional[Dict[str, Any]] = None,
+):
     """5. Output Quality"""
     print("\n" + "=" * 70)
     print("5. OUTPUT QUALITY")
@@ -457,7 +663,7 @@ def check_quality(final_state: Optional[ResearchState]):
         print_test_result("quality", "Report structure follows template", False, "No report available")
         return
     
-    report = final_state.get("final_report", "") or final_state.get("report_draft", "")
+    report = _report_text(final_state)
     validation_result = final_state.get("validation_result", {})
     retrieved_chunks = final_state.get("retrieved_chunks", [])
     
@@ -476,7 +682,9 @@ def check_quality(final_state: Optional[ResearchState]):
         print_test_result("quality", "Report is 1000+ words", False, f"Word count: {word_count} (below 1000)")
     
     # Check citations
-    citation_count = report.count("[Source")
+    if citations is None:
+        citations = _scan_citations(report)
+    citation_count = citations["count"]
     if citation_count > 0:
         print_test_result("quality", "Report contains citations", True, f"Found {citation_count} citations")
     else:
@@ -500,10 +708,11 @@ def check_quality(final_state: Optional[ResearchState]):
         print_test_result("quality", "Citations reference valid sources", False, "No validation data")
         print_test_result("quality", "All claims have citations", False, "No validation data")
     
-    # Check report structure
-    has_intro = any(keyword in report.lower() for keyword in ["introduction", "overview", "summary"])
-    has_findings = any(keyword in report.lower() for keyword in ["findings", "results", "discoveries"])
-    has_conclusion = any(keyword in report.lower() for keyword in ["conclusion", "summary", "concluding"])
+    # Check report structure (one scan collects every section keyword present)
+    hits = set(_STRUCTURE_RE.findall(report.lower()))
+    has_intro = bool(hits & {"introduction", "overview", "summary"})
+    has_findings = bool(hits & {"findings", "results", "discoveries"})
+    has_conclusion = bool(hits & {"conclusion", "summary", "concluding"})
     
     structure_score = sum([has_intro, has_findings, has_conclusion])
     if structure_score >= 2:
@@ -512,21 +721,32 @@ def check_quality(final_state: Optional[ResearchState]):
         print_test_result("quality", "Report structure follows template", False, f"Structure score: {structure_score}/3")
 
 
-def generate_report():
+def generate_report(mode: str = "full"):
     """Generate M3 completion report"""
     print("\n" + "=" * 70)
     print("M3 COMPLETION REPORT")
     print("=" * 70)
     
-    # Calculate totals
+    # Single pass: totals, per-category stats and the JSON test lists
     total_tests = 0
     passed_tests = 0
+    categories = {}
     
     for category, tests in test_results.items():
+        if not tests:
+            continue  # Category not run in this mode
+        category_passed = 0
+        category_tests = []
         for test_name, passed, message in tests:
-            total_tests += 1
-            if passed:
-                passed_tests += 1
+            category_passed += passed
+            category_tests.append({"name": test_name, "passed": passed, "message": message})
+        categories[category] = {
+            "total": len(tests),
+            "passed": category_passed,
+            "tests": category_tests,
+        }
+        total_tests += len(tests)
+        passed_tests += category_passed
     
     pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
     
@@ -537,53 +757,47 @@ def generate_report():
     
     # Category breakdown
     print("\nCategory Breakdown:")
-    for category, tests in test_results.items():
-        category_passed = sum(1 for _, passed, _ in tests if passed)
-        category_total = len(tests)
-        category_rate = (category_passed / category_total * 100) if category_total > 0 else 0
-        print(f"  {category.capitalize()}: {category_passed}/{category_total} ({category_rate:.1f}%)")
+    for category, stats in categories.items():
+        category_rate = stats["passed"] / stats["total"] * 100
+        print(f"  {category.capitalize()}: {stats['passed']}/{stats['total']} ({category_rate:.1f}%)")
     
-    # M3 completion status
+    # M3 completion status (live/ready runs only cover part of M3)
+    label = "M3 COMPLETION" if mode == "full" else f"M3 {mode.upper()} CHECK"
     print("\n" + "=" * 70)
     if pass_rate >= 90:
-        print("[PASS] M3 COMPLETION: PASSED")
-        print("All critical requirements met. M3 milestone is complete.")
+        print(f"[PASS] {label}: PASSED")
+        if mode == "full":
+            print("All critical requirements met. M3 milestone is complete.")
+        else:
+            print(f"All {mode} checks met. Run with --mode full to validate M3 completion.")
     elif pass_rate >= 75:
-        print("[WARN] M3 COMPLETION: PARTIAL")
+        print(f"[WARN] {label}: PARTIAL")
         print("Most requirements met, but some issues need attention.")
     else:
-        print("[FAIL] M3 COMPLETION: FAILED")
+        print(f"[FAIL] {label}: FAILED")
         print("Multiple requirements not met. Please review and fix issues.")
     print("=" * 70)
     
     # Save report to file
-    report_file = project_root / "logs" / f"m3_validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    report_file = project_root / "logs" / f"m3_validation_report_{RUN_TS.strftime('%Y%m%d_%H%M%S')}.json"
     report_data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": RUN_TS_ISO,
+        "mode": mode,
         "total_tests": total_tests,
         "passed_tests": passed_tests,
         "failed_tests": total_tests - passed_tests,
         "pass_rate": pass_rate,
-        "categories": {
-            category: {
-                "total": len(tests),
-                "passed": sum(1 for _, passed, _ in tests if passed),
-                "tests": [
-                    {
-                        "name": test_name,
-                        "passed": passed,
-                        "message": message
-                    }
-                    for test_name, passed, message in tests
-                ]
-            }
-            for category, tests in test_results.items()
-        }
+        "categories": categories,
     }
     
     report_file.parent.mkdir(exist_ok=True)
-    with open(report_file, 'w') as f:
-        json.dump(report_data, f, indent=2)
+    if orjson is not None:
+        report_file.write_bytes(
+            orjson.dumps(report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+    else:
+        with open(report_file, 'w') as f:
+            json.dump(report_data, f, indent=2)
     
     print(f"\nDetailed report saved to: {report_file}")
     
@@ -592,21 +806,38 @@ def generate_report():
 
 def main():
     """Main validation function"""
+    parser = argparse.ArgumentParser(description="Validate M3 completion")
+    parser.add_argument(
+        "--mode",
+        choices=["live", "ready", "full"],
+        default="full",
+        help=(
+            "live: environment and dependency checks only; "
+            "ready: also run each agent; "
+            "full: also run the end-to-end workflow, performance and quality checks"
+        ),
+    )
+    args = parser.parse_args()
+    
     print("=" * 70)
     print("M3 COMPLETION VALIDATION")
     print("=" * 70)
-    print(f"Timestamp: {datetime.now().isoformat()}")
+    print(f"Timestamp: {RUN_TS_ISO}")
     print(f"Project Root: {project_root}")
-    
-    # Run all checks
-    check_environment()
-    check_agents()
-    final_state, execution_time = check_integration()
-    check_performance(final_state, execution_time)
-    check_quality(final_state)
+    print(f"Mode: {args.mode}")
+    
+    # Run the checks for the selected mode
+    asyncio.run(check_environment())
+    if args.mode in ("ready", "full"):
+        asyncio.run(check_agents())
+    if args.mode == "full":
+        final_state, execution_time = check_integration()
+        citations = _scan_citations(_report_text(final_state))
+        check_performance(final_state, execution_time, citations)
+        check_quality(final_state, citations)
     
     # Generate report
-    passed = generate_report()
+    passed = generate_report(args.mode)
     
     # Exit with appropriate code
     sys.exit(0 if passed else 1)
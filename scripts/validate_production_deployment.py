@@ -9,51 +9,118 @@ Usage:
 """
 
 import argparse
-import requests
+import asyncio
+import functools
+import hashlib
+import httpx
+import json
 import sys
 import time
-from typing import Dict, List, Tuple
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Tuple
 from datetime import datetime
 
+# A healthy host accepts connections in well under a second, so the connect
+# budget is kept short and almost all of the wait goes to reading the reply
+CONNECT_TIMEOUT = 0.5
+READ_TIMEOUT_DEFAULT = 4.5
+READ_TIMEOUT_RESEARCH = 9.5
 
-def check_health(api_url: str) -> Tuple[bool, str]:
+# Opt-in cache of passing probe results for repeated runs (--cache-ttl)
+CACHE_DIR = Path.home() / ".cache" / "aira-validate"
+CACHE_TTL = 0.0
+
+
+def create_client() -> httpx.AsyncClient:
+    """Create the shared HTTP client (keep-alive pool, HTTP/2 where available)."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(READ_TIMEOUT_DEFAULT, connect=CONNECT_TIMEOUT, pool=None),
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    )
+
+
+async def probe(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """Fetch only the status line, falling back to an unread GET if HEAD isn't routed."""
+    response = await client.head(url, follow_redirects=True)
+    if response.status_code in (405, 501):
+        async with client.stream("GET", url) as response:
+            pass
+    return response
+
+
+def cached_check(
+    check: Callable[[httpx.AsyncClient, str], Awaitable[Tuple[bool, str]]]
+) -> Callable[[httpx.AsyncClient, str], Awaitable[Tuple[bool, str]]]:
+    """Reuse a passing result for the same URL while it is younger than CACHE_TTL."""
+    @functools.wraps(check)
+    async def wrapper(client: httpx.AsyncClient, url: str) -> Tuple[bool, str]:
+        if CACHE_TTL <= 0:
+            return await check(client, url)
+        
+        path = CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+        try:
+            record = json.loads(path.read_text())
+            if time.time() - record["ts"] < CACHE_TTL:
+                return record["status"], record["message"]
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        success, message = await check(client, url)
+        # Failures are never cached so a recovered service is seen right away
+        if success:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps({"status": success, "message": message, "ts": time.time()}))
+            except OSError:
+                pass
+        return success, message
+    return wrapper
+
+
+# Never cached: this is the fail-fast gate, so it must always reflect a live probe
+async def check_health(client: httpx.AsyncClient, url: str) -> Tuple[bool, str]:
     """Check if API health endpoint is responding."""
     try:
-        response = requests.get(f"{api_url}/health", timeout=5)
+        response = await client.get(url)
         if response.status_code == 200:
             data = response.json()
             return True, f"✅ Health check passed: {data.get('status', 'ok')}"
         else:
             return False, f"❌ Health check failed: Status {response.status_code}"
-    except requests.exceptions.RequestException as e:
-        return False, f"❌ Health check failed: {str(e)}"
+    except httpx.HTTPError as e:
+        return False, f"❌ Health check failed: {str(e) or type(e).__name__}"
 
 
-def check_api_docs(api_url: str) -> Tuple[bool, str]:
+@cached_check
+async def check_api_docs(client: httpx.AsyncClient, url: str) -> Tuple[bool, str]:
     """Check if API documentation is accessible."""
     try:
-        response = requests.get(f"{api_url}/docs", timeout=5)
+        response = await probe(client, url)
         if response.status_code == 200:
             return True, "✅ API documentation accessible"
         else:
             return False, f"❌ API docs failed: Status {response.status_code}"
-    except requests.exceptions.RequestException as e:
-        return False, f"❌ API docs failed: {str(e)}"
+    except httpx.HTTPError as e:
+        return False, f"❌ API docs failed: {str(e) or type(e).__name__}"
 
 
-def check_streamlit(streamlit_url: str) -> Tuple[bool, str]:
+@cached_check
+async def check_streamlit(client: httpx.AsyncClient, url: str) -> Tuple[bool, str]:
     """Check if Streamlit is accessible."""
     try:
-        response = requests.get(f"{streamlit_url}/_stcore/health", timeout=5)
+        response = await probe(client, url)
         if response.status_code == 200:
             return True, "✅ Streamlit health check passed"
         else:
             return False, f"❌ Streamlit health check failed: Status {response.status_code}"
-    except requests.exceptions.RequestException as e:
-        return False, f"❌ Streamlit health check failed: {str(e)}"
+    except httpx.HTTPError as e:
+        return False, f"❌ Streamlit health check failed: {str(e) or type(e).__name__}"
 
 
-def test_research_endpoint(api_url: str) -> Tuple[bool, str, str]:
+async def test_research_endpoint(client: httpx.AsyncClient, url: str) -> Tuple[bool, str, str]:
     """Test submitting a research query."""
     test_query = {
         "query": "What are the latest advances in transformer architectures?",
@@ -61,10 +128,10 @@ def test_research_endpoint(api_url: str) -> Tuple[bool, str, str]:
     }
     
     try:
-        response = requests.post(
-            f"{api_url}/api/v1/research",
+        response = await client.post(
+            url,
             json=test_query,
-            timeout=10
+            timeout=httpx.Timeout(READ_TIMEOUT_RESEARCH, connect=CONNECT_TIMEOUT, pool=None)
         )
         
         if response.status_code == 201:
@@ -73,33 +140,59 @@ def test_research_endpoint(api_url: str) -> Tuple[bool, str, str]:
             return True, f"✅ Research query submitted successfully", task_id
         else:
             return False, f"❌ Research query failed: Status {response.status_code}", None
-    except requests.exceptions.RequestException as e:
-        return False, f"❌ Research query failed: {str(e)}", None
+    except httpx.HTTPError as e:
+        return False, f"❌ Research query failed: {str(e) or type(e).__name__}", None
 
 
-def check_task_status(api_url: str, task_id: str) -> Tuple[bool, str]:
+async def check_task_status(client: httpx.AsyncClient, status_fmt: str, task_id: str) -> Tuple[bool, str]:
     """Check task status endpoint."""
     try:
-        response = requests.get(f"{api_url}/api/v1/status/{task_id}", timeout=5)
+        response = await client.get(status_fmt.format(task_id))
         if response.status_code == 200:
             data = response.json()
             status = data.get("status", "unknown")
             return True, f"✅ Task status retrieved: {status}"
         else:
             return False, f"❌ Task status failed: Status {response.status_code}"
-    except requests.exceptions.RequestException as e:
-        return False, f"❌ Task status failed: {str(e)}"
+    except httpx.HTTPError as e:
+        return False, f"❌ Task status failed: {str(e) or type(e).__name__}"
+
+
+async def poll_task_status(
+    client: httpx.AsyncClient,
+    status_fmt: str,
+    task_id: str,
+    max_wait: float = 2.0
+) -> Tuple[bool, str]:
+    """Poll the status endpoint with backoff until the new task is visible."""
+    url = status_fmt.format(task_id)
+    delay = 0.05
+    elapsed = 0.0
+    while True:
+        try:
+            response = await client.get(url)
+            if response.status_code == 200:
+                status = response.json().get("status", "unknown")
+                return True, f"✅ Task status retrieved: {status}"
+            message = f"❌ Task status failed: Status {response.status_code}"
+        except httpx.HTTPError as e:
+            message = f"❌ Task status failed: {str(e) or type(e).__name__}"
+        
+        if elapsed >= max_wait:
+            return False, message
+        await asyncio.sleep(delay)
+        elapsed += delay
+        delay = min(delay * 2, 0.5)
 
 
-def validate_rate_limiting(api_url: str) -> Tuple[bool, str]:
+async def validate_rate_limiting(client: httpx.AsyncClient, url: str) -> Tuple[bool, str]:
     """Test rate limiting by making multiple rapid requests."""
     try:
-        # Make 10 rapid requests to status endpoint
-        responses = []
-        for i in range(10):
-            response = requests.get(f"{api_url}/api/v1/health", timeout=2)
-            responses.append(response.status_code)
-            time.sleep(0.1)
+        # Fire 10 requests as one burst so they land inside the same window.
+        # The limiter runs as middleware, so HEAD counts even where the route
+        # itself only answers GET, and no response bodies are transferred
+        responses = await asyncio.gather(*[client.head(url) for _ in range(10)])
+        responses = [response.status_code for response in responses]
         
         # Check if rate limiting kicked in (429 status)
         rate_limited = any(status == 429 for status in responses)
@@ -107,62 +200,106 @@ def validate_rate_limiting(api_url: str) -> Tuple[bool, str]:
             return True, "✅ Rate limiting is working"
         else:
             return True, "ℹ️  Rate limiting not triggered (may need more requests)"
-    except requests.exceptions.RequestException as e:
-        return False, f"❌ Rate limit test failed: {str(e)}"
+    except httpx.HTTPError as e:
+        return False, f"❌ Rate limit test failed: {str(e) or type(e).__name__}"
 
 
-def run_validation(api_url: str, streamlit_url: str = None) -> Dict[str, List[Tuple[bool, str]]]:
+async def run_validation(
+    api_url: str,
+    streamlit_url: str = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> bool:
     """Run all validation checks."""
-    results = {
-        "API Checks": [],
-        "Functionality Tests": [],
-        "Security Checks": []
-    }
+    # (category, success, message) in display order
+    log: List[Tuple[str, bool, str]] = []
     
     print("🔍 Starting Production Deployment Validation\n")
     print("=" * 60)
     
+    # Resolve every endpoint once up front
+    urls = {
+        "health": f"{api_url}/health",
+        "docs": f"{api_url}/docs",
+        "research": f"{api_url}/api/v1/research",
+        "rate": f"{api_url}/api/v1/health",
+        "status_fmt": f"{api_url}/api/v1/status/{{}}",
+    }
+    
+    async def research_then_status() -> Tuple[Tuple[bool, str, str], Optional[Tuple[bool, str]]]:
+        # The task status check is the only one that depends on another
+        submitted = await test_research_endpoint(client, urls["research"])
+        task_id = submitted[2]
+        if not task_id:
+            return submitted, None
+        return submitted, await poll_task_status(client, urls["status_fmt"], task_id)
+    
+    owns_client = client is None
+    if owns_client:
+        client = create_client()
+    try:
+        # Fail fast: every other check would just wait out its own timeout
+        # against a server that isn't answering /health
+        outcomes = {"health": await check_health(client, urls["health"])}
+        if not outcomes["health"][0]:
+            print("\n1️⃣ API Health Checks:")
+            print("-" * 60)
+            print(f"   {outcomes['health'][1]}")
+            print("\n⛔ Skipping remaining checks: server unreachable")
+            return False
+        
+        # Every other check is an independent I/O wait, so run them side by side
+        checks = [
+            check_api_docs(client, urls["docs"]),
+            research_then_status(),
+            validate_rate_limiting(client, urls["rate"]),
+        ]
+        if streamlit_url:
+            checks.append(check_streamlit(client, f"{streamlit_url}/_stcore/health"))
+        outcomes.update(zip(
+            ("docs", "research", "rate_limit", "streamlit"),
+            await asyncio.gather(*checks)
+        ))
+    finally:
+        if owns_client:
+            await client.aclose()
+    outcomes["research"], outcomes["task_status"] = outcomes["research"]
+    
     # API Health Checks
     print("\n1️⃣ API Health Checks:")
     print("-" * 60)
     
-    success, message = check_health(api_url)
-    results["API Checks"].append((success, message))
-    print(f"   {message}")
-    
-    success, message = check_api_docs(api_url)
-    results["API Checks"].append((success, message))
-    print(f"   {message}")
+    for name in ("health", "docs"):
+        success, message = outcomes[name]
+        log.append(("API Checks", success, message))
+        print(f"   {message}")
     
     # Streamlit Check (optional)
     if streamlit_url:
         print("\n2️⃣ Streamlit Checks:")
         print("-" * 60)
-        success, message = check_streamlit(streamlit_url)
-        results["API Checks"].append((success, message))
+        success, message = outcomes["streamlit"]
+        log.append(("API Checks", success, message))
         print(f"   {message}")
     
     # Functionality Tests
     print("\n3️⃣ Functionality Tests:")
     print("-" * 60)
     
-    success, message, task_id = test_research_endpoint(api_url)
-    results["Functionality Tests"].append((success, message))
+    success, message, task_id = outcomes["research"]
+    log.append(("Functionality Tests", success, message))
     print(f"   {message}")
     
     if task_id:
-        # Wait a moment for task to be created
-        time.sleep(2)
-        success, message = check_task_status(api_url, task_id)
-        results["Functionality Tests"].append((success, message))
+        success, message = outcomes["task_status"]
+        log.append(("Functionality Tests", success, message))
         print(f"   {message}")
     
     # Security Checks
     print("\n4️⃣ Security Checks:")
     print("-" * 60)
     
-    success, message = validate_rate_limiting(api_url)
-    results["Security Checks"].append((success, message))
+    success, message = outcomes["rate_limit"]
+    log.append(("Security Checks", success, message))
     print(f"   {message}")
     
     # Summary
@@ -170,17 +307,15 @@ def run_validation(api_url: str, streamlit_url: str = None) -> Dict[str, List[Tu
     print("📊 Validation Summary:")
     print("=" * 60)
     
-    total_checks = 0
-    passed_checks = 0
+    total_checks = len(log)
+    passed_checks = sum(1 for _, success, _ in log if success)
     
-    for category, checks in results.items():
+    for category, checks in groupby(log, key=itemgetter(0)):
         print(f"\n{category}:")
-        for success, message in checks:
-            total_checks += 1
-            if success:
-                passed_checks += 1
+        for _, success, message in checks:
             status = "✅" if success else "❌"
-            print(f"   {status} {message.split(':')[1] if ':' in message else message}")
+            tail = message.partition(':')[2].strip()
+            print(f"   {status} {tail or message}")
     
     print(f"\n📈 Results: {passed_checks}/{total_checks} checks passed")
     
@@ -193,6 +328,8 @@ def run_validation(api_url: str, streamlit_url: str = None) -> Dict[str, List[Tu
 
 
 def main():
+    global CACHE_TTL, CONNECT_TIMEOUT, READ_TIMEOUT_DEFAULT
+    
     parser = argparse.ArgumentParser(
         description="Validate production deployment on EC2"
     )
@@ -208,10 +345,33 @@ def main():
         default=None,
         help="Base URL of Streamlit (optional, e.g., http://localhost:8501)"
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=0,
+        help="Reuse passing docs/Streamlit results younger than this many seconds; the health gate is always probed live (default: 0, disabled)"
+    )
+    
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=CONNECT_TIMEOUT,
+        help=f"Seconds to wait for a TCP connection (default: {CONNECT_TIMEOUT})"
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=READ_TIMEOUT_DEFAULT,
+        help=f"Seconds to wait for a response; research submission uses {READ_TIMEOUT_RESEARCH} (default: {READ_TIMEOUT_DEFAULT})"
+    )
     
     args = parser.parse_args()
     
-    success = run_validation(args.api_url, args.streamlit_url)
+    CACHE_TTL = args.cache_ttl
+    CONNECT_TIMEOUT = args.connect_timeout
+    READ_TIMEOUT_DEFAULT = args.read_timeout
+    
+    success = asyncio.run(run_validation(args.api_url, args.streamlit_url))
     sys.exit(0 if success else 1)
 
 
@@ -5,11 +5,39 @@ Run this after setting up your .env file
 
 import boto3
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 load_dotenv()
 
+# (variable, mask its value when printing)
+CHECKS = (
+    ('AWS_ACCESS_KEY_ID', True),
+    ('AWS_SECRET_ACCESS_KEY', True),
+    ('AWS_REGION', False),
+    ('S3_BUCKET_NAME', False),
+)
+
+# Enough top-level prefixes to confirm the layout without walking a large bucket
+MAX_FOLDERS = 50
+
+def list_folders(s3, bucket, limit=MAX_FOLDERS):
+    """Return up to `limit` top-level prefixes, fetching pages only as needed"""
+    paginator = s3.get_paginator('list_objects_v2')
+    pages = paginator.paginate(
+        Bucket=bucket,
+        Delimiter='/',
+        PaginationConfig={'PageSize': 100}
+    )
+    folders = []
+    for page in pages:
+        folders.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
+        if len(folders) >= limit:
+            break
+    return sorted(folders[:limit])
+
 def verify_access():
     """Verify AWS S3 access is configured correctly"""
     
@@ -18,92 +46,101 @@ def verify_access():
     
     # Check environment variables
     print("\n1️⃣ Checking Environment Variables:")
-    access_key = os.getenv('AWS_ACCESS_KEY_ID')
-    secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
-    region = os.getenv('AWS_REGION')
-    bucket = os.getenv('S3_BUCKET_NAME')
-    
-    checks = {
-        'AWS_ACCESS_KEY_ID': access_key,
-        'AWS_SECRET_ACCESS_KEY': secret_key,
-        'AWS_REGION': region,
-        'S3_BUCKET_NAME': bucket
-    }
-    
+    env = os.environ
     missing = []
-    for key, value in checks.items():
+    for name, mask in CHECKS:
+        value = env.get(name)
         if value:
-            if 'KEY' in key or 'SECRET' in key:
-                display = value[:8] + '*' * 10
-            else:
-                display = value
-            print(f"   ✅ {key}: {display}")
+            display = f"{value[:8]}{'*' * 10}" if mask else value
+            print(f"   ✅ {name}: {display}")
         else:
-            print(f"   ❌ {key}: NOT SET")
-            missing.append(key)
+            print(f"   ❌ {name}: NOT SET")
+            missing.append(name)
     
     if missing:
         print(f"\n❌ Missing variables: {', '.join(missing)}")
         print("💡 Add these to your .env file")
         return False
     
+    region = env['AWS_REGION']
+    bucket = env['S3_BUCKET_NAME']
+    
     # Test S3 connection
     print("\n2️⃣ Testing S3 Connection:")
-    try:
-        s3 = boto3.client('s3', region_name=region)
-        response = s3.list_buckets()
-        print(f"   ✅ Connected to AWS S3")
-        print(f"   📊 You can see {len(response['Buckets'])} bucket(s)")
-    except ClientError as e:
-        print(f"   ❌ Connection failed: {e}")
-        return False
+    s3 = boto3.client(
+        's3',
+        region_name=region,
+        config=Config(max_pool_connections=10, tcp_keepalive=True)
+    )
     
-    # Test project bucket access
-    print("\n3️⃣ Testing Project Bucket Access:")
-    try:
-        # Try to list objects (even if empty)
-        response = s3.list_objects_v2(Bucket=bucket, MaxKeys=1)
-        print(f"   ✅ You have READ access to '{bucket}'")
+    # The read-only calls don't depend on each other, so issue them together
+    # over the client's shared connection pool; only put -> delete is ordered
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        bucket_future = ex.submit(s3.head_bucket, Bucket=bucket)
+        read_future = ex.submit(s3.list_objects_v2, Bucket=bucket, MaxKeys=1)
+        folders_future = ex.submit(list_folders, s3, bucket)
         
-        # Try to put a test object
-        test_key = 'test/.team_access_test.txt'
-        s3.put_object(
-            Bucket=bucket, 
-            Key=test_key, 
-            Body=b'Team access test'
-        )
-        print(f"   ✅ You have WRITE access to '{bucket}'")
+        # HeadBucket checks credentials and the project bucket in one call
+        try:
+            bucket_future.result()
+            print(f"   ✅ Connected to AWS S3 and bucket '{bucket}' exists")
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code in ('404', 'NoSuchBucket'):
+                print(f"   ❌ Bucket '{bucket}' does not exist")
+                print(f"   💡 Ask Natnicha to run: python scripts/setup_s3.py --create-markers")
+            elif error_code in ('403', 'AccessDenied'):
+                print(f"   ❌ Access denied to '{bucket}'")
+                print(f"   💡 Ask Natnicha to verify you're in the IAM user group")
+            else:
+                print(f"   ❌ Connection failed: {e}")
+            return False
         
-        # Clean up test object
-        s3.delete_object(Bucket=bucket, Key=test_key)
-        print(f"   ✅ You have DELETE access to '{bucket}'")
+        # Test project bucket access
+        print("\n3️⃣ Testing Project Bucket Access:")
+        try:
+            # Try to list objects (even if empty)
+            read_future.result()
+            print(f"   ✅ You have READ access to '{bucket}'")
+            
+            # Try to put a test object
+            test_key = 'test/.team_access_test.txt'
+            s3.put_object(
+                Bucket=bucket, 
+                Key=test_key, 
+                Body=b'Team access test'
+            )
+            print(f"   ✅ You have WRITE access to '{bucket}'")
+            
+            # Clean up test object
+            s3.delete_object(Bucket=bucket, Key=test_key)
+            print(f"   ✅ You have DELETE access to '{bucket}'")
+            
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code == 'NoSuchBucket':
+                print(f"   ❌ Bucket '{bucket}' does not exist")
+                print(f"   💡 Ask Natnicha to run: python scripts/setup_s3.py --create-markers")
+            elif error_code == 'AccessDenied':
+                print(f"   ❌ Access denied to '{bucket}'")
+                print(f"   💡 Ask Natnicha to verify you're in the IAM user group")
+            else:
+                print(f"   ❌ Error: {e}")
+            return False
         
-    except ClientError as e:
-        error_code = e.response['Error']['Code']
-        if error_code == 'NoSuchBucket':
-            print(f"   ❌ Bucket '{bucket}' does not exist")
-            print(f"   💡 Ask Natnicha to run: python scripts/setup_s3.py")
-        elif error_code == 'AccessDenied':
-            print(f"   ❌ Access denied to '{bucket}'")
-            print(f"   💡 Ask Natnicha to verify you're in the IAM user group")
-        else:
-            print(f"   ❌ Error: {e}")
-        return False
-    
-    # Check folder structure
-    print("\n4️⃣ Checking Bucket Structure:")
-    try:
-        response = s3.list_objects_v2(Bucket=bucket, Delimiter='/')
-        if 'CommonPrefixes' in response:
-            folders = [p['Prefix'] for p in response['CommonPrefixes']]
-            print(f"   ✅ Found {len(folders)} folders:")
-            for folder in sorted(folders):
-                print(f"      • {folder}")
-        else:
-            print(f"   ⚠️  No folders found (bucket might be empty)")
-            print(f"   💡 Run: python scripts/setup_s3.py")
-    except Exception as e:
-        print(f"   ⚠️  Could not list folders: {e}")
+        # Check folder structure
+        print("\n4️⃣ Checking Bucket Structure:")
+        try:
+            folders = folders_future.result()
+            if folders:
+                print(f"   ✅ Found {len(folders)} folders:")
+                for folder in folders:
+                    print(f"      • {folder}")
+            else:
+                print(f"   ⚠️  No folders found (bucket might be empty)")
+                print(f"   💡 Run: python scripts/setup_s3.py --create-markers")
+        except Exception as e:
+            print(f"   ⚠️  Could not list folders: {e}")
     
     print("\n" + "="*60)
     print("🎉 All checks passed! You're ready to work on the project.")
@@ -180,6 +180,14 @@ def search_agent_node(state: ResearchState) -> ResearchState:
     new_state: ResearchState = dict(state)  # type: ignore[assignment]
     new_state["current_agent"] = "search_agent"
 
+    # A rejected report leaves its results in place; start this attempt clean
+    if state.get("regeneration_reset"):
+        new_state["search_results"] = []
+        new_state["retrieved_chunks"] = []
+        new_state["report_draft"] = ""
+        new_state["validation_result"] = {}
+        new_state["regeneration_reset"] = False
+
     user_query = state.get("user_query")  # type: ignore[assignment]
     if not user_query or not isinstance(user_query, str) or not user_query.strip():
         msg = "search_agent_node: 'user_query' is missing or empty in state"
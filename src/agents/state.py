@@ -67,6 +67,10 @@ class ResearchState(TypedDict, total=False):
 
         regeneration_count: Number of times the report has been regenerated
             due to rejection. Used to prevent infinite loops.
+
+        regeneration_reset: Set when a reviewer rejects the report. The
+            previous run's results are left in place until the search
+            agent starts the next attempt and resets them.
     """
 
     task_id: str
@@ -82,6 +86,7 @@ class ResearchState(TypedDict, total=False):
     error: Optional[str]
     current_agent: str
     regeneration_count: int
+    regeneration_reset: bool
 
 
 __all__ = ["ResearchState"]
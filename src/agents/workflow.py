@@ -75,6 +75,14 @@ def handle_max_retries_node(state: ResearchState) -> ResearchState:
         f"Max regeneration attempts ({regeneration_count}) exceeded. Report could not be improved after multiple attempts."
     )
     new_state["final_report"] = ""
+    # The search agent that would clear the rejected attempt never runs again,
+    # so drop it here rather than leave a rejected draft in the final state
+    if state.get("regeneration_reset"):
+        new_state["search_results"] = []
+        new_state["retrieved_chunks"] = []
+        new_state["report_draft"] = ""
+        new_state["validation_result"] = {}
+        new_state["regeneration_reset"] = False
     logger.error(
         "Max regenerations exceeded, ending workflow | task_id=%s | attempts=%d",
         task_id,
@@ -162,7 +170,7 @@ def route_after_hitl(
     MAX_REGENERATIONS = 2  # Maximum number of regeneration attempts
 
     # Check if report was rejected
-    is_rejected = (
+    is_rejected = state.get("regeneration_reset") or (
         error and "rejected" in error.lower() and "regeneration" in error.lower()
     )
 
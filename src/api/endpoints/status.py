@@ -2,11 +2,14 @@
 Status API Endpoint
 """
 
+import hashlib
 import logging
 import uuid
 from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Path, status
+from fastapi import APIRouter, Header, HTTPException, Path, status
+from fastapi.responses import Response
 
 from ..models import ErrorResponse, StatusResponse, TaskStatus
 from ..task_manager import get_task_manager
@@ -18,10 +21,14 @@ router = APIRouter(prefix="/api/v1", tags=["status"])
 
 @router.get("/status/{task_id}", response_model=StatusResponse)
 async def get_task_status(
-    task_id: str = Path(..., description="Task identifier (UUID)")
+    task_id: str = Path(..., description="Task identifier (UUID)"),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Get the status of a research task
+
+    The response carries an ETag of its body. Pollers that send it back in
+    If-None-Match get an empty 304 Not Modified until the status changes.
     """
     # Validate UUID format
     try:
@@ -46,7 +53,7 @@ async def get_task_status(
     if task.get("updated_at"):
         updated_at = datetime.fromisoformat(task["updated_at"])
 
-    return StatusResponse(
+    body = StatusResponse(
         task_id=task_id,
         status=TaskStatus(task["status"]),
         progress=task.get("progress"),
@@ -54,4 +61,12 @@ async def get_task_status(
         created_at=created_at,
         updated_at=updated_at,
         error=task.get("error"),
-    )
+    ).model_dump_json()
+
+    etag = f'"{hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]}"'
+    # Clients must revalidate every poll; an unchanged status costs no body
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -6,10 +6,11 @@ import json
 import logging
 import os
 import sqlite3
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from .models import TaskStatus
 
@@ -48,6 +49,10 @@ class TaskManager:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        # Status updates queued per task until flush_status_updates()
+        self._pending_updates: Dict[
+            str, Deque[Tuple[TaskStatus, Optional[float], Optional[str]]]
+        ] = {}
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
         logger.info(f"TaskManager initialized with database: {db_path}")
@@ -278,6 +283,48 @@ class TaskManager:
 
         logger.info(f"Updated task {task_id} status to {status.value}")
 
+    def queue_status_update(
+        self,
+        task_id: str,
+        status: TaskStatus,
+        progress: Optional[float] = None,
+        message: Optional[str] = None,
+    ):
+        """
+        Queue a status update to be written by flush_status_updates
+
+        Args:
+            task_id: Task identifier
+            status: New status
+            progress: Optional progress (0-100)
+            message: Optional status message
+        """
+        self._pending_updates.setdefault(task_id, deque(maxlen=8)).append(
+            (status, progress, message)
+        )
+
+    def flush_status_updates(self, task_id: str) -> bool:
+        """
+        Write the queued status updates for a task as a single update
+
+        Updates are last-write-wins: only the newest queued update is written,
+        with its own progress and message. Fields it leaves as None keep their
+        stored values rather than taking text queued for an earlier status.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            True if an update was written, False if nothing was queued
+        """
+        updates = self._pending_updates.pop(task_id, None)
+        if not updates:
+            return False
+
+        status, progress, message = updates[-1]
+        self.update_task_status(task_id, status, progress=progress, message=message)
+        return True
+
     def store_task_result(
         self,
         task_id: str,
@@ -378,12 +425,11 @@ class TaskManager:
         Returns:
             True if successful, False if task not found or not pending review
         """
-        task = self.get_task(task_id)
-        if not task or task["status"] != TaskStatus.PENDING_REVIEW.value:
-            return False
-
         now = datetime.utcnow().isoformat()
 
+        # The pending-review check is part of the UPDATE, so a decision is
+        # delivered with one lock acquisition and two concurrent decisions
+        # cannot both succeed
         with _db_lock:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
@@ -395,14 +441,24 @@ class TaskManager:
                     needs_hitl = 0,
                     message = ?,
                     updated_at = ?
-                WHERE task_id = ?
+                WHERE task_id = ? AND status = ?
             """,
-                (TaskStatus.COMPLETED.value, "Report approved", now, task_id),
+                (
+                    TaskStatus.COMPLETED.value,
+                    "Report approved",
+                    now,
+                    task_id,
+                    TaskStatus.PENDING_REVIEW.value,
+                ),
             )
+            updated = cursor.rowcount > 0
 
             conn.commit()
             conn.close()
 
+        if not updated:
+            return False
+
         logger.info(f"Approved review for task {task_id}")
         return True
 
@@ -417,10 +473,6 @@ class TaskManager:
         Returns:
             True if successful, False if task not found or not pending review
         """
-        task = self.get_task(task_id)
-        if not task or task["status"] != TaskStatus.PENDING_REVIEW.value:
-            return False
-
         now = datetime.utcnow().isoformat()
 
         with _db_lock:
@@ -435,7 +487,7 @@ class TaskManager:
                     status = ?,
                     message = ?,
                     updated_at = ?
-                WHERE task_id = ?
+                WHERE task_id = ? AND status = ?
             """,
                 (
                     edited_report,
@@ -443,12 +495,17 @@ class TaskManager:
                     "Report edited and approved",
                     now,
                     task_id,
+                    TaskStatus.PENDING_REVIEW.value,
                 ),
             )
+            updated = cursor.rowcount > 0
 
             conn.commit()
             conn.close()
 
+        if not updated:
+            return False
+
         logger.info(f"Edited report for task {task_id}")
         return True
 
@@ -185,6 +185,10 @@ def log_state_transition(
         task_id: Optional task ID for context.
         **kwargs: Additional context to log.
     """
+    # Skip building the message when INFO records would be dropped anyway
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     context = f" | task_id={task_id}" if task_id else ""
     for key, value in kwargs.items():
         context += f" | {key}={value}"
@@ -246,6 +250,9 @@ def log_performance_metrics(
         task_id: Optional task ID for context.
         **metrics: Additional metrics to log (e.g., items_processed=100).
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     context = f" | task_id={task_id}" if task_id else ""
     for key, value in metrics.items():
         context += f" | {key}={value}"
@@ -19,6 +19,10 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Query embedding model and the vector size the Pinecone index expects
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSION = 1536
+
 
 def _get_pinecone_index() -> Any:
     """
@@ -77,7 +81,7 @@ def query_to_embedding(query: str, task_id: Optional[str] = None) -> List[float]
     try:
         result = client.create_embedding(
             query,
-            model="text-embedding-3-small",
+            model=EMBEDDING_MODEL,
             operation="embedding",
             task_id=task_id,
         )
@@ -87,9 +91,11 @@ def query_to_embedding(query: str, task_id: Optional[str] = None) -> List[float]
             raise ValueError("Received invalid embedding from OpenAI")
 
         # Optional sanity check on dimension (1536 for text-embedding-3-small)
-        if len(embedding) != 1536:
+        if len(embedding) != EMBEDDING_DIMENSION:
             logger.warning(
-                "Expected 1536-dimensional embedding, got %d dimensions", len(embedding)
+                "Expected %d-dimensional embedding, got %d dimensions",
+                EMBEDDING_DIMENSION,
+                len(embedding),
             )
 
         return embedding  # type: ignore[return-value]
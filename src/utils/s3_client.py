@@ -6,8 +6,10 @@ Handles all S3 operations for the project
 import logging
 import os
 from pathlib import Path
+from typing import Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 
@@ -17,10 +19,25 @@ load_dotenv()
 class S3Client:
     """Wrapper for S3 operations"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        session: Optional[boto3.session.Session] = None,
+        config: Optional[Config] = None,
+    ):
+        """
+        Create the S3 client
+
+        Args:
+            session: Optional boto3 Session to build the client from. Sharing
+                one session lets several clients reuse resolved credentials.
+            config: Optional botocore Config (connection pool size,
+                keep-alive, retry mode, ...) for the underlying client.
+        """
         self.bucket = os.getenv("S3_BUCKET_NAME")
         self.region = os.getenv("AWS_REGION", "us-east-1")
-        self.s3 = boto3.client("s3", region_name=self.region)
+        self.s3 = (session or boto3).client(
+            "s3", region_name=self.region, config=config
+        )
         self.logger = logging.getLogger(__name__)
 
     def upload_file(self, local_path: str, s3_key: str) -> bool:
@@ -42,6 +59,25 @@ class S3Client:
             self.logger.error(f"Failed to upload {local_path}: {e}")
             return False
 
+    def put_bytes(self, s3_key: str, data: bytes) -> bool:
+        """
+        Write in-memory bytes to S3 without a local file
+
+        Args:
+            s3_key: S3 key (path in bucket)
+            data: Object body
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self.s3.put_object(Bucket=self.bucket, Key=s3_key, Body=data)
+            self.logger.info(f"Wrote {len(data)} bytes to s3://{self.bucket}/{s3_key}")
+            return True
+        except ClientError as e:
+            self.logger.error(f"Failed to write {s3_key}: {e}")
+            return False
+
     def download_file(self, s3_key: str, local_path: str) -> bool:
         """
         Download a file from S3
@@ -72,7 +72,7 @@ def main():
     print("=" * 70)
     
     # Run HITL review
-    state = hitl_review_node(state)
+    state = {**state, **hitl_review_node(state)}
     
     final_report = state.get('final_report', '')
     error = state.get('error')
@@ -6,6 +6,7 @@ Tests for search_agent, synthesis_agent, validation_agent, and workflow integrat
 
 import json
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, Mock, patch
@@ -16,11 +17,21 @@ import pytest
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.agents import hitl_review
+from src.agents.hitl_review import (
+    _is_interactive_mode,
+    hitl_review_node,
+    reset_interactive_mode_cache,
+)
 from src.agents.search_agent import search_agent_node
 from src.agents.state import ResearchState
 from src.agents.synthesis_agent import synthesis_agent_node
 from src.agents.validation_agent import validation_agent_node, verify_citations
-from src.agents.workflow import compiled_workflow
+from src.agents.workflow import (
+    compiled_workflow,
+    handle_max_retries_node,
+    route_after_hitl,
+)
 
 # ============================================================================
 # FIXTURES
@@ -254,6 +265,64 @@ def test_search_agent_empty_query(
     )
 
 
+@patch("src.agents.search_agent.OpenAIClient")
+@patch("src.agents.search_agent.semantic_search")
+def test_search_agent_resets_after_rejection(
+    mock_semantic_search,
+    mock_openai_client,
+    sample_state: ResearchState,
+    mock_openai_search_response: Dict[str, Any],
+    mock_pinecone_results: List[Dict[str, Any]],
+):
+    """Test that a rejected report is routed back to search and reset there."""
+    mock_client_instance = Mock()
+    mock_client_instance.chat_completion.return_value = mock_openai_search_response
+    mock_openai_client.return_value = mock_client_instance
+    mock_semantic_search.return_value = mock_pinecone_results[:2]
+
+    sample_state.update(
+        {
+            "retrieved_chunks": [{"chunk_id": "stale"}],
+            "report_draft": "Rejected draft",
+            "validation_result": {"valid": False},
+            "regeneration_count": 1,
+            "regeneration_reset": True,
+        }
+    )
+    assert route_after_hitl(sample_state) == "search"
+
+    result_state = search_agent_node(sample_state)
+
+    assert result_state["regeneration_reset"] is False
+    assert result_state["retrieved_chunks"] == []
+    assert result_state["report_draft"] == ""
+    assert result_state["validation_result"] == {}
+    assert len(result_state["search_results"]) > 0
+
+
+def test_max_retries_clears_rejected_report(sample_state: ResearchState):
+    """Test that the max-retries exit does not keep the rejected draft."""
+    sample_state.update(
+        {
+            "retrieved_chunks": [{"chunk_id": "stale"}],
+            "report_draft": "Rejected draft",
+            "validation_result": {"valid": False},
+            "regeneration_count": 3,
+            "regeneration_reset": True,
+        }
+    )
+    assert route_after_hitl(sample_state) == "handle_max_retries"
+
+    result_state = handle_max_retries_node(sample_state)
+
+    assert result_state["regeneration_reset"] is False
+    assert result_state["retrieved_chunks"] == []
+    assert result_state["report_draft"] == ""
+    assert result_state["validation_result"] == {}
+    assert result_state["final_report"] == ""
+    assert "Max regeneration attempts" in result_state["error"]
+
+
 # ============================================================================
 # SYNTHESIS AGENT TESTS
 # ============================================================================
@@ -564,6 +633,59 @@ def test_workflow_error_handling(
     )
 
 
+# ============================================================================
+# HITL REVIEW TESTS
+# ============================================================================
+
+
+@patch("src.agents.hitl_review.TASK_MANAGER_AVAILABLE", False)
+@patch("src.agents.hitl_review._display_validation_info")
+@patch("src.agents.hitl_review._display_report_summary")
+@patch("src.agents.hitl_review._prompt_user_action", return_value="reject")
+@patch("src.agents.hitl_review._is_interactive_mode", return_value=True)
+def test_hitl_review_rejects_identical_regenerated_draft(
+    mock_interactive, mock_prompt, mock_summary, mock_validation_info, monkeypatch
+):
+    """Test that a regenerated draft identical to a rejected one is rejected again."""
+    # Fresh review cache so no decision leaks into or out of this test
+    monkeypatch.setattr(hitl_review, "_REVIEW_CACHE", OrderedDict())
+    state: ResearchState = {
+        "task_id": "test_hitl_cache",
+        "needs_hitl": True,
+        "report_draft": "Transformers use attention [Source 1].",
+        "validation_result": {"valid": True},
+        "confidence_score": 0.5,
+        "regeneration_count": 0,
+    }
+
+    first = hitl_review_node(state)
+    # The regeneration pass produced the same draft for the same task
+    regenerated = {**state, "regeneration_count": first["regeneration_count"]}
+    second = hitl_review_node(regenerated)
+
+    mock_prompt.assert_called_once()
+    assert first["regeneration_count"] == 1
+    assert second["regeneration_count"] == 2
+    assert second["regeneration_reset"] is True
+    assert second["final_report"] == ""
+
+
+def test_interactive_mode_probe_reset(monkeypatch):
+    """Test that the memoized interactive-mode probe can be reset."""
+    monkeypatch.delenv("API_MODE", raising=False)
+    try:
+        # Patching isatty in place keeps the same stdin object, so the memo
+        # would otherwise return the answer from before the patch
+        with patch.object(sys.stdin, "isatty", return_value=True):
+            reset_interactive_mode_cache()
+            assert _is_interactive_mode() is True
+
+        monkeypatch.setenv("API_MODE", "true")
+        assert _is_interactive_mode() is False
+    finally:
+        reset_interactive_mode_cache()
+
+
 # ============================================================================
 # HELPER FUNCTION TESTS
 # ============================================================================
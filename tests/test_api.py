@@ -451,6 +451,20 @@ def test_get_task_status_caching(client: TestClient, sample_task_id: str):
     assert response1.json() == response2.json()
 
 
+def test_get_task_status_not_modified(client: TestClient, sample_task_id: str):
+    """Test that an unchanged status is revalidated with a 304."""
+    response1 = client.get(f"/api/v1/status/{sample_task_id}")
+    assert response1.status_code == 200
+    etag = response1.headers["ETag"]
+
+    response2 = client.get(
+        f"/api/v1/status/{sample_task_id}", headers={"If-None-Match": etag}
+    )
+    assert response2.status_code == 304
+    assert response2.content == b""
+    assert response2.headers["ETag"] == etag
+
+
 # ============================================================================
 # Tests for GET /api/v1/report/{task_id}
 # ============================================================================